@@ -1,126 +1,823 @@
 import os
-from typing import List, Dict, Any, Optional
+import re
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
 from langchain_community.llms import Ollama
 from langchain.chains import LLMChain
 from langchain.prompts import PromptTemplate
+from langchain.embeddings.base import Embeddings
 from langchain_community.embeddings import HuggingFaceEmbeddings
 from langchain_community.vectorstores import Chroma
-from langchain.text_splitter import CharacterTextSplitter
+from langchain.text_splitter import RecursiveCharacterTextSplitter
 import json
 import time
+import atexit
+import functools
+import numpy as np
 from pathlib import Path
 
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configuration
 OLLAMA_ENDPOINT = os.getenv("OLLAMA_ENDPOINT", "http://localhost:11434")
 DEFAULT_MODEL = "llama3"
+# Quantized variant for chains that only need a short numeric answer
+FAST_MODEL = os.getenv("OLLAMA_FAST_MODEL", "llama3:8b-instruct-q4_K_M")
+# Concurrent LLM calls per request; matches the Ollama server's parallelism by default
+MAX_CONCURRENT_LLM_CALLS = int(os.getenv("OLLAMA_NUM_PARALLEL", "8"))
 PERSIST_DIRECTORY = "chroma_db"
-RESUME_DATABASE = "resume_database.json"
+RESUME_DATABASE = "resume_database.db"
+LEGACY_RESUME_DATABASE = "resume_database.json"  # Migrated into SQLite on first run
+RESUME_VECTORS = "resume_vectors.npz"
+CHUNK_INDEX = "resume_chunks.faiss"
+CHUNK_INDEX_IDS = "resume_chunks.json"
+# Search goes through an exact in-process FAISS index; set this for very large (>100K chunk) corpora
+USE_CHROMA_SEARCH = os.getenv("USE_CHROMA_SEARCH", "false").lower() == "true"
+NEAR_DUPLICATE_JACCARD = 0.9  # Chunks sharing more 5-word shingles than this are dropped
+PERSIST_INTERVAL = 5  # Seconds between background checkpoints of the vector data
+# Fake-resume heuristic scores below this read clearly human and skip the LLM; anything higher
+# goes to the LLM, which alone can flag a resume and point at the suspicious text
+FAKE_SCREEN_HUMAN_MAX = 0.3
+LLM_RERANK_TOP_K = 10  # Candidates re-scored by the LLM when use_llm_score is set
+LLM_RERANK_MIN_SIMILARITY = float(os.getenv("LLM_RERANK_MIN_SIMILARITY", "0.2"))  # Cosine floor for LLM re-scoring
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+EMBEDDING_CACHE_DB = "embedding_cache.db"
+EMBEDDING_CACHE_SIZE = 1024
+SEARCH_CANDIDATE_FACTOR = 5  # Chunks fetched per requested search result
+LLM_CACHE_DB = "llm_cache.db"
+LLM_CACHE_SIZE = 256
+CHUNK_TOKENS = 256  # all-MiniLM-L6-v2 truncates at 256 word pieces
+CHUNK_OVERLAP_TOKENS = 32
+
+_SCORE_RE = re.compile(r"(\d{1,3}(?:\.\d+)?)")
+
+
+def _parse_score(text: str) -> float:
+    """First number in an LLM reply, as a 0-1 match score"""
+    match = _SCORE_RE.search(text)
+    return min(float(match.group(1)), 100) / 100 if match else 0.0
+
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _dot_rows_i8_kernel(mat, q, out):
+        # One thread per block of rows; int8 products accumulate in int32 without upcasting mat
+        for i in prange(mat.shape[0]):
+            acc = 0
+            for j in range(mat.shape[1]):
+                acc += np.int32(mat[i, j]) * np.int32(q[j])
+            out[i] = acc
+
+
+def _dot_rows_i8(mat: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """Dot product of every int8 row of mat with the int8 vector q, as int32"""
+    if njit is None:
+        return mat @ q.astype(np.int32)
+    out = np.empty(mat.shape[0], dtype=np.int32)
+    _dot_rows_i8_kernel(mat, q, out)
+    return out
+
 
 # Initialize the LLM with Ollama
+# keep_alive=-1 keeps the model loaded between requests instead of unloading after 5 minutes
 llm = Ollama(
     model=DEFAULT_MODEL,
     base_url=OLLAMA_ENDPOINT,
-    temperature=0.1
+    temperature=0.1,
+    keep_alive=-1
 )
 
+fast_llm = Ollama(
+    model=FAST_MODEL,
+    base_url=OLLAMA_ENDPOINT,
+    temperature=0.1,
+    keep_alive=-1
+)
+
+class CachedEmbeddings(Embeddings):
+    """Embedding wrapper that caches query vectors in memory (LRU) and on disk (SQLite)"""
+    
+    def __init__(self, base: Embeddings, cache_path: str = EMBEDDING_CACHE_DB, maxsize: int = EMBEDDING_CACHE_SIZE):
+        self.base = base
+        self.maxsize = maxsize
+        # Vectors depend on the model and encode settings, so they are part of the cache key
+        self._namespace = f"{getattr(base, 'model_name', '')}|{sorted(getattr(base, 'encode_kwargs', {}).items())}"
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(cache_path, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS query_embeddings (hash TEXT PRIMARY KEY, vec BLOB)")
+        self._conn.commit()
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.base.embed_documents(texts)
+    
+    def embed_query(self, text: str) -> List[float]:
+        key = hashlib.sha256(f"{self._namespace}\0{text}".encode("utf-8")).hexdigest()
+        
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            row = self._conn.execute("SELECT vec FROM query_embeddings WHERE hash = ?", (key,)).fetchone()
+        
+        if row is not None:
+            vec = np.frombuffer(row[0], dtype=np.float32).tolist()
+        else:
+            # Cache miss: run the model once and remember the result across restarts
+            arr = np.asarray(self.base.embed_query(text), dtype=np.float32)
+            vec = arr.tolist()
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO query_embeddings (hash, vec) VALUES (?, ?)",
+                    (key, arr.tobytes())
+                )
+                self._conn.commit()
+        
+        with self._lock:
+            self._cache[key] = vec
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return vec
+
+
+class LLMResponseCache:
+    """Exact-match cache of LLM chain outputs, in memory (LRU) and on disk (SQLite)"""
+    
+    def __init__(self, cache_path: str = LLM_CACHE_DB, maxsize: int = LLM_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(cache_path, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS llm_responses (hash TEXT PRIMARY KEY, response TEXT)")
+        self._conn.commit()
+    
+    @staticmethod
+    def key(chain: LLMChain, inputs: Dict[str, Any]) -> str:
+        """Hash the model, prompt template and prompt inputs of a chain call"""
+        model = getattr(chain.llm, "model", "")
+        payload = _json_dumps({"model": model, "template": chain.prompt.template, "inputs": inputs})
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            row = self._conn.execute("SELECT response FROM llm_responses WHERE hash = ?", (key,)).fetchone()
+        if row is not None:
+            self._remember(key, row[0])
+            return row[0]
+        return None
+    
+    def put(self, key: str, response: str):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (hash, response) VALUES (?, ?)",
+                (key, response)
+            )
+            self._conn.commit()
+        self._remember(key, response)
+    
+    def _remember(self, key: str, response: str):
+        with self._lock:
+            self._cache[key] = response
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+    
+    def run(self, chain: LLMChain, **inputs) -> str:
+        """chain.run(**inputs), answered from the cache when the same call was made before"""
+        key = self.key(chain, inputs)
+        result = self.get(key)
+        if result is None:
+            result = chain.run(**inputs)
+            self.put(key, result)
+        return result
+    
+    async def arun(self, chain: LLMChain, **inputs) -> str:
+        """Async counterpart of run"""
+        key = self.key(chain, inputs)
+        result = self.get(key)
+        if result is None:
+            result = await chain.arun(**inputs)
+            self.put(key, result)
+        return result
+    
+    async def astream(self, chain: LLMChain, **inputs):
+        """Yield the chain's output as it is generated, caching the full text once it completes"""
+        key = self.key(chain, inputs)
+        result = self.get(key)
+        if result is not None:
+            yield result
+            return
+        parts = []
+        async for token in chain.llm.astream(chain.prompt.format(**inputs)):
+            parts.append(token)
+            yield token
+        self.put(key, "".join(parts))
+
+
+_EMBEDDINGS = None
+_LLM_CACHE = None
+
+
+def _get_embeddings() -> CachedEmbeddings:
+    """Shared embedding model, loaded once per process"""
+    global _EMBEDDINGS
+    if _EMBEDDINGS is None:
+        import torch
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        base = HuggingFaceEmbeddings(
+            model_name=EMBEDDING_MODEL,
+            model_kwargs={"device": device},
+            encode_kwargs={"batch_size": 64, "normalize_embeddings": True}
+        )
+        if device == "cuda":
+            # Inference only, so fp16 halves memory traffic without hurting retrieval
+            base.client.half()
+        _EMBEDDINGS = CachedEmbeddings(base)
+    return _EMBEDDINGS
+
+
+def _get_llm_cache() -> LLMResponseCache:
+    """Shared LLM response cache, opened once per process"""
+    global _LLM_CACHE
+    if _LLM_CACHE is None:
+        _LLM_CACHE = LLMResponseCache()
+    return _LLM_CACHE
+
+
 class ResumeStore:
     """Manages storage and retrieval of resume data"""
     
+    JSON_ARRAY = re.compile(r"\[[\s\S]*\]")
+    
     def __init__(self, db_path: str = RESUME_DATABASE):
         self.db_path = db_path
         self.resumes = self._load_db()
+        self._init_feedback_counters()
         
         # Ensure vector store directory exists
         os.makedirs(PERSIST_DIRECTORY, exist_ok=True)
         
         # Initialize embedding function (using HuggingFace for free embeddings)
-        self.embeddings = HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
+        # The model is shared across stores and query embeddings are cached
+        self.embeddings = _get_embeddings()
         
         # Initialize or load vector store
         if os.path.exists(PERSIST_DIRECTORY) and len(os.listdir(PERSIST_DIRECTORY)) > 0:
             self.vector_store = Chroma(persist_directory=PERSIST_DIRECTORY, embedding_function=self.embeddings)
         else:
             self.vector_store = Chroma(persist_directory=PERSIST_DIRECTORY, embedding_function=self.embeddings)
+        
+        # Splits on paragraph, then line, then word boundaries; built once and reused
+        self._splitter = self._build_splitter()
+        
+        # Prompt-ready summary blocks for candidate sets; cleared whenever a resume changes
+        self._summaries_block = functools.lru_cache(maxsize=256)(self._build_summaries_block)
+        
+        # Use a simple prompt to get a match percentage
+        self.match_prompt = PromptTemplate(
+            input_variables=["resume", "job"],
+            template="""
+            You are evaluating how well a candidate's resume matches a job description.
+            
+            Resume:
+            {resume}
+            
+            Job Description:
+            {job}
+            
+            On a scale of 0 to 100, where 100 means perfect match and 0 means no match at all,
+            assign a score based on skills, experience, and qualifications match.
+            Return ONLY the numeric score without explanation.
+            """
+        )
+        
+        self._match_chain = LLMChain(llm=fast_llm, prompt=self.match_prompt)
+        
+        # Scores several resumes against one job description in a single call
+        self.batch_match_prompt = PromptTemplate(
+            input_variables=["resumes", "job"],
+            template="""
+            You are evaluating how well each candidate's resume matches a job description.
+            
+            Resumes (JSON array of objects with "id" and "summary"):
+            {resumes}
+            
+            Job Description:
+            {job}
+            
+            For every resume, assign a score on a scale of 0 to 100, where 100 means perfect match
+            and 0 means no match at all, based on skills, experience, and qualifications match.
+            Return ONLY a JSON array in this format, with one entry per resume id:
+            [{{"id": "...", "score": 0}}]
+            """
+        )
+        
+        self._batch_match_chain = LLMChain(llm=fast_llm, prompt=self.batch_match_prompt)
+        
+        # Vector data is checkpointed in the background rather than on every insert;
+        # the lock keeps checkpoints from seeing a half-applied insert
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._use_faiss = faiss is not None and not USE_CHROMA_SEARCH
+        
+        # Mean chunk embedding per resume, one row each, used for cosine match scoring
+        self._load_vectors()
+        self._backfill_vectors()
+        
+        # Chroma remains the system of record; FAISS mirrors the chunk vectors for search
+        if self._use_faiss:
+            self._load_chunk_index()
+        
+        atexit.register(self.persist)
+        self._schedule_checkpoint()
     
-    def _load_db(self) -> Dict:
-        if os.path.exists(self.db_path):
+    def _build_splitter(self) -> RecursiveCharacterTextSplitter:
+        """Size chunks in embedding-model tokens, falling back to characters if no tokenizer is available"""
+        separators = ["\n\n", "\n", " ", ""]
+        tokenizer = getattr(getattr(self.embeddings.base, "client", None), "tokenizer", None)
+        if tokenizer is not None:
             try:
-                with open(self.db_path, 'r') as f:
-                    return json.load(f)
-            except:
-                return {"resumes": {}}
+                return RecursiveCharacterTextSplitter.from_huggingface_tokenizer(
+                    tokenizer,
+                    chunk_size=CHUNK_TOKENS,
+                    chunk_overlap=CHUNK_OVERLAP_TOKENS,
+                    separators=separators
+                )
+            except (ImportError, ValueError) as e:
+                print(f"Warning: token-aware splitting unavailable, using character chunks: {e}")
+        return RecursiveCharacterTextSplitter(
+            chunk_size=1000,
+            chunk_overlap=100,
+            separators=separators
+        )
+    
+    def _load_db(self) -> Dict:
+        """Open the SQLite store and load every resume into memory for fast reads"""
+        self._conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # In WAL mode NORMAL only syncs at checkpoints, so small writes don't each wait on fsync
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS resumes (id TEXT PRIMARY KEY, summary TEXT, metadata TEXT)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS feedback (resume_id TEXT, ts REAL, is_positive INTEGER, text TEXT)")
+        
+        if self._conn.execute("SELECT COUNT(*) FROM resumes").fetchone()[0] == 0:
+            self._migrate_json(LEGACY_RESUME_DATABASE)
+        
+        resumes = {}
+        for rid, summary, metadata in self._conn.execute("SELECT id, summary, metadata FROM resumes"):
+            resumes[rid] = {"summary": summary, "metadata": _json_loads(metadata)}
+        for rid, ts, is_positive, text in self._conn.execute(
+            "SELECT resume_id, ts, is_positive, text FROM feedback ORDER BY rowid"
+        ):
+            if rid in resumes:
+                resumes[rid].setdefault("feedback", []).append({
+                    "timestamp": ts,
+                    "is_positive": bool(is_positive),
+                    "text": text
+                })
+        return {"resumes": resumes}
+    
+    def _init_feedback_counters(self):
+        """One-time scan for the rolling counters behind get_feedback_stats"""
+        self._fb_pos = 0
+        self._fb_neg = 0
+        self._fb_resumes = set()
+        for rid in self.resumes["resumes"]:
+            self._count_feedback(rid, 1)
+    
+    def _count_feedback(self, resume_id: str, sign: int):
+        """Add (sign=1) or remove (sign=-1) a resume's stored feedback from the counters"""
+        feedback = self.resumes["resumes"].get(resume_id, {}).get("feedback", [])
+        if not feedback:
+            return
+        positive = sum(1 for fb in feedback if fb["is_positive"])
+        self._fb_pos += sign * positive
+        self._fb_neg += sign * (len(feedback) - positive)
+        if sign > 0:
+            self._fb_resumes.add(resume_id)
         else:
-            return {"resumes": {}}
+            self._fb_resumes.discard(resume_id)
+    
+    def _migrate_json(self, json_path: str):
+        """One-time import of the old whole-file JSON store"""
+        if not os.path.exists(json_path):
+            return
+        try:
+            with open(json_path, 'rb') as f:
+                legacy = _json_loads(f.read())
+        except:
+            return
+        
+        self._conn.execute("BEGIN")
+        for rid, data in legacy.get("resumes", {}).items():
+            self._conn.execute(
+                "INSERT OR REPLACE INTO resumes (id, summary, metadata) VALUES (?, ?, ?)",
+                (rid, data.get("summary", ""), _json_dumps(data.get("metadata", {})))
+            )
+            for feedback in data.get("feedback", []):
+                self._conn.execute(
+                    "INSERT INTO feedback (resume_id, ts, is_positive, text) VALUES (?, ?, ?, ?)",
+                    (rid, feedback["timestamp"], int(feedback["is_positive"]), feedback.get("text"))
+                )
+        self._conn.execute("COMMIT")
     
-    def _save_db(self):
-        with open(self.db_path, 'w') as f:
-            json.dump(self.resumes, f)
+    def _load_vectors(self):
+        self._ids: List[str] = []
+        self._mat = np.zeros((0, 0), dtype=np.int8)
+        self._scales = np.zeros(0, dtype=np.float32)
+        if os.path.exists(RESUME_VECTORS):
+            try:
+                data = np.load(RESUME_VECTORS)
+                self._ids = data["ids"].tolist()
+                if "scales" in data:
+                    self._mat = np.ascontiguousarray(data["vecs"], dtype=np.int8)
+                    self._scales = data["scales"].astype(np.float32)
+                else:
+                    # Older stores kept float32 rows; quantize them on load
+                    rows = [self._quantize(vec) for vec in data["vecs"]]
+                    self._mat = np.stack([q for q, _ in rows]) if rows else self._mat
+                    self._scales = np.array([scale for _, scale in rows], dtype=np.float32)
+            except Exception:
+                self._ids = []
+                self._mat = np.zeros((0, 0), dtype=np.int8)
+                self._scales = np.zeros(0, dtype=np.float32)
+        self._id_index = {rid: i for i, rid in enumerate(self._ids)}
+    
+    def _save_vectors(self):
+        if not self._ids:
+            return
+        n = len(self._ids)
+        np.savez(RESUME_VECTORS, ids=np.array(self._ids), vecs=self._mat[:n], scales=self._scales[:n])
+    
+    @staticmethod
+    def _quantize(vec: np.ndarray) -> Tuple[np.ndarray, float]:
+        """Symmetric int8 quantization with a per-vector scale"""
+        peak = float(np.max(np.abs(vec))) if len(vec) else 0.0
+        scale = peak / 127 if peak else 1.0
+        return np.round(vec / scale).astype(np.int8), scale
+    
+    def _set_vector(self, resume_id: str, vec: np.ndarray):
+        """Insert or overwrite a resume's row in the match matrix"""
+        row = self._id_index.get(resume_id)
+        if row is None:
+            row = len(self._ids)
+            if row == self._mat.shape[0]:
+                # Grow the buffers geometrically so appends stay amortized O(1)
+                capacity = max(16, row * 2)
+                grown = np.zeros((capacity, vec.shape[0]), dtype=np.int8)
+                scales = np.zeros(capacity, dtype=np.float32)
+                if row:
+                    grown[:row] = self._mat[:row]
+                    scales[:row] = self._scales[:row]
+                self._mat, self._scales = grown, scales
+            self._ids.append(resume_id)
+            self._id_index[resume_id] = row
+        self._mat[row], self._scales[row] = self._quantize(vec)
+    
+    def _backfill_vectors(self):
+        """Rebuild match vectors for resumes stored before they were tracked"""
+        for rid in self.resumes["resumes"]:
+            if rid in self._id_index:
+                continue
+            stored = self.vector_store._collection.get(where={"resume_id": rid}, include=["embeddings"])
+            embeddings = stored.get("embeddings")
+            if embeddings is not None and len(embeddings) > 0:
+                summary = self.resumes["resumes"][rid].get("summary")
+                summary_vec = self.embeddings.embed_documents([summary])[0] if summary else None
+                self._set_vector(rid, self._match_vector(np.asarray(embeddings, dtype=np.float32), summary_vec))
+                self._dirty = True
+    
+    def _load_chunk_index(self):
+        self.chunk_index = None
+        self._next_chunk_id = 0
+        self._chunk_ids: Dict[str, List[int]] = {}
+        # Digest of the summary each resume's chunks were indexed with, to spot re-adds missed by a crash
+        self._chunk_digests: Dict[str, str] = {}
+        if os.path.exists(CHUNK_INDEX) and os.path.exists(CHUNK_INDEX_IDS):
+            try:
+                self.chunk_index = faiss.read_index(CHUNK_INDEX)
+                with open(CHUNK_INDEX_IDS, 'rb') as f:
+                    data = _json_loads(f.read())
+                self._next_chunk_id = data["next_id"]
+                self._chunk_ids = data["chunks"]
+                self._chunk_digests = data.get("digests", {})
+            except Exception:
+                self.chunk_index = None
+                self._next_chunk_id = 0
+                self._chunk_ids = {}
+                self._chunk_digests = {}
+        self._chunk_owner = {cid: rid for rid, cids in self._chunk_ids.items() for cid in cids}
+        
+        self._sync_chunk_index()
+    
+    def _sync_chunk_index(self):
+        """Bring the FAISS mirror in line with Chroma after a first run or a crash between checkpoints"""
+        # Chunk counts per resume from metadata alone; embeddings are only fetched for resumes that differ
+        stored = self.vector_store._collection.get(include=["metadatas"])
+        counts: Dict[str, int] = {}
+        for meta in stored.get("metadatas") or []:
+            counts[meta["resume_id"]] = counts.get(meta["resume_id"], 0) + 1
+        
+        for rid in [rid for rid in self._chunk_ids if rid not in counts or rid not in self.resumes["resumes"]]:
+            # Resume deleted (or never committed) since the index was saved
+            self._drop_chunks(rid)
+            self._dirty = True
+        
+        for rid, count in counts.items():
+            if rid not in self.resumes["resumes"]:
+                continue
+            if len(self._chunk_ids.get(rid, ())) == count and self._chunk_digests.get(rid) == self._resume_digest(rid):
+                continue
+            # Added or re-added after the last checkpoint: index the chunks Chroma committed
+            chunk_data = self.vector_store._collection.get(where={"resume_id": rid}, include=["embeddings"])
+            embeddings = chunk_data.get("embeddings")
+            if embeddings is not None and len(embeddings) > 0:
+                self._index_chunks(rid, np.asarray(embeddings, dtype=np.float32))
+                self._dirty = True
+    
+    def _save_chunk_index(self):
+        if self.chunk_index is None:
+            return
+        faiss.write_index(self.chunk_index, CHUNK_INDEX)
+        with open(CHUNK_INDEX_IDS, 'w') as f:
+            f.write(_json_dumps({
+                "next_id": self._next_chunk_id, "chunks": self._chunk_ids, "digests": self._chunk_digests
+            }))
+    
+    def _resume_digest(self, resume_id: str) -> str:
+        summary = self.resumes["resumes"][resume_id].get("summary") or ""
+        return hashlib.blake2b(summary.encode("utf-8"), digest_size=8).hexdigest()
+    
+    def _drop_chunks(self, resume_id: str):
+        """Remove a resume's chunk vectors from the FAISS index"""
+        old_ids = self._chunk_ids.pop(resume_id, [])
+        self._chunk_digests.pop(resume_id, None)
+        if old_ids:
+            self.chunk_index.remove_ids(np.asarray(old_ids, dtype=np.int64))
+            for cid in old_ids:
+                self._chunk_owner.pop(cid, None)
+    
+    def _index_chunks(self, resume_id: str, vectors: np.ndarray):
+        """Add a resume's chunk vectors to the FAISS index, replacing any previous ones"""
+        if self.chunk_index is None:
+            self.chunk_index = faiss.IndexIDMap2(faiss.IndexFlatIP(vectors.shape[1]))
+        
+        self._drop_chunks(resume_id)
+        
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32).copy()
+        faiss.normalize_L2(vectors)
+        new_ids = list(range(self._next_chunk_id, self._next_chunk_id + len(vectors)))
+        self._next_chunk_id += len(vectors)
+        # Owners first, so any id a search can find already maps to its resume
+        for cid in new_ids:
+            self._chunk_owner[cid] = resume_id
+        self.chunk_index.add_with_ids(vectors, np.asarray(new_ids, dtype=np.int64))
+        self._chunk_ids[resume_id] = new_ids
+        if resume_id in self.resumes["resumes"]:
+            self._chunk_digests[resume_id] = self._resume_digest(resume_id)
+    
+    def _search_chunks(self, query_vec: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        """Return (owning resume id, cosine similarity) for the top k chunks, best first"""
+        # Searches run in worker threads while add_resume may be changing the index
+        with self._lock:
+            if self.chunk_index is None or self.chunk_index.ntotal == 0:
+                return []
+            scores, found = self.chunk_index.search(query_vec[None, :], min(k, self.chunk_index.ntotal))
+            return [(self._chunk_owner[int(cid)], float(score))
+                    for cid, score in zip(found[0], scores[0]) if cid != -1]
+    
+    @staticmethod
+    def _normalize(vec) -> np.ndarray:
+        vec = np.asarray(vec, dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+    
+    def _mean_vector(self, vectors: np.ndarray) -> np.ndarray:
+        """Average L2-normalized chunk embeddings into a single unit vector"""
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        return self._normalize((vectors / norms).mean(axis=0))
+    
+    def _match_vector(self, chunk_vectors: np.ndarray, summary_vec=None) -> np.ndarray:
+        """Blend a resume's chunk embeddings and its summary embedding into one unit vector"""
+        vec = self._mean_vector(chunk_vectors)
+        if summary_vec is not None:
+            vec = self._normalize(vec + self._normalize(summary_vec))
+        return vec
     
     def add_resume(self, resume_id: str, resume_text: str, summary: str, metadata: Dict = None):
-        """Add a resume to both the JSON store and vector database"""
+        """Add a resume to both the resume database and vector database"""
         if metadata is None:
             metadata = {}
             
-        # Add to simple JSON store
-        self.resumes["resumes"][resume_id] = {
-            "summary": summary,
-            "metadata": metadata
-        }
-        self._save_db()
+        # Add to the resume database; re-adding a resume starts its feedback over
+        # The lock keeps callers on other threads from interleaving with the transaction
+        with self._lock:
+            self._count_feedback(resume_id, -1)
+            self.resumes["resumes"][resume_id] = {
+                "summary": summary,
+                "metadata": metadata
+            }
+            self._conn.execute("BEGIN")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO resumes (id, summary, metadata) VALUES (?, ?, ?)",
+                (resume_id, summary, _json_dumps(metadata))
+            )
+            self._conn.execute("DELETE FROM feedback WHERE resume_id = ?", (resume_id,))
+            self._conn.execute("COMMIT")
+            self._summaries_block.cache_clear()
         
         # Add to vector store for semantic search
-        text_splitter = CharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
-        chunks = text_splitter.split_text(resume_text)
-        
-        for i, chunk in enumerate(chunks):
-            self.vector_store.add_texts(
-                texts=[chunk],
-                metadatas=[{"resume_id": resume_id, "chunk_id": i, **metadata}],
-                ids=[f"{resume_id}_chunk_{i}"]
-            )
+        chunks = self._drop_near_duplicates(self._splitter.split_text(resume_text))
+        
+        # Embed all chunks plus the summary as a single batch; the summary only feeds the match vector
+        if chunks:
+            ids = [f"{resume_id}_chunk_{i}" for i in range(len(chunks))]
+            metadatas = [{"resume_id": resume_id, "chunk_id": i, **metadata} for i in range(len(chunks))]
+            embedded = np.asarray(self.embeddings.embed_documents(chunks + [summary]), dtype=np.float32)
+            vectors, summary_vec = embedded[:-1], embedded[-1]
+        
+        with self._lock:
+            # A shorter re-add would only overwrite the first chunks, so drop the old ones first
+            self.vector_store._collection.delete(where={"resume_id": resume_id})
+            if self._use_faiss:
+                self._drop_chunks(resume_id)
+            self._dirty = True
+            if chunks:
+                # Same upsert add_texts performs, minus the second embedding pass
+                self.vector_store._collection.upsert(
+                    ids=ids, embeddings=vectors.tolist(), documents=chunks, metadatas=metadatas
+                )
+                self._set_vector(resume_id, self._match_vector(vectors, summary_vec))
+                if self._use_faiss:
+                    self._index_chunks(resume_id, vectors)
         
-        self.vector_store.persist()
         return resume_id
     
+    @staticmethod
+    def _shingles(text: str, size: int = 5) -> set:
+        words = text.lower().split()
+        if len(words) <= size:
+            return {tuple(words)}
+        return {tuple(words[i:i + size]) for i in range(len(words) - size + 1)}
+    
+    def _drop_near_duplicates(self, chunks: List[str]) -> List[str]:
+        """Drop chunks that repeat an earlier chunk of the same resume, before they are embedded"""
+        kept, kept_shingles = [], []
+        for chunk in chunks:
+            shingles = self._shingles(chunk)
+            if any(len(shingles & other) / len(shingles | other) > NEAR_DUPLICATE_JACCARD
+                   for other in kept_shingles):
+                continue
+            kept.append(chunk)
+            kept_shingles.append(shingles)
+        return kept
+    
+    def persist(self):
+        """Flush pending vector store writes to disk"""
+        with self._lock:
+            if self._dirty:
+                self.vector_store.persist()
+                self._save_vectors()
+                if self._use_faiss:
+                    self._save_chunk_index()
+                self._dirty = False
+    
+    def _schedule_checkpoint(self):
+        timer = threading.Timer(PERSIST_INTERVAL, self._checkpoint)
+        timer.daemon = True
+        timer.start()
+    
+    def _checkpoint(self):
+        try:
+            self.persist()
+        except Exception as e:
+            print(f"Error persisting vector store: {e}")
+        finally:
+            self._schedule_checkpoint()
+    
     def get_resume(self, resume_id: str) -> Optional[Dict]:
         """Get a resume by ID"""
         if resume_id in self.resumes["resumes"]:
             return self.resumes["resumes"][resume_id]
         return None
     
+    def summaries_block(self, resume_ids: List[str], label: str = "Resume ID") -> str:
+        """Join the summaries of the given resumes into one prompt block, in a canonical order"""
+        return self._summaries_block(tuple(sorted(set(resume_ids))), label)
+    
+    def _build_summaries_block(self, resume_ids: Tuple[str, ...], label: str) -> str:
+        return "\n\n---\n\n".join(
+            f"{label}: {rid}\n{self.resumes['resumes'][rid]['summary']}"
+            for rid in resume_ids
+            if rid in self.resumes["resumes"]
+        )
+    
     def get_all_resumes(self) -> List[Dict]:
         """Get all resumes with their IDs"""
-        return [{"id": k, **v} for k, v in self.resumes["resumes"].items()]
+        with self._lock:
+            return [{"id": k, **v} for k, v in self.resumes["resumes"].items()]
     
     def search_resumes(self, query: str, n_results: int = 5) -> List[Dict]:
         """Search resumes by semantic similarity"""
-        results = self.vector_store.similarity_search(query, k=n_results)
-        resume_ids = set([doc.metadata["resume_id"] for doc in results])
+        # Pull a wider pool of chunks so one resume's many chunks can't crowd out the others,
+        # then score each resume by its best chunk (higher is better)
+        k = n_results * SEARCH_CANDIDATE_FACTOR
+        if self._use_faiss:
+            query_vec = self._normalize(self.embeddings.embed_query(query))
+            hits = self._search_chunks(query_vec, k)
+        else:
+            results = self.vector_store.similarity_search_by_vector_with_relevance_scores(
+                self.embeddings.embed_query(query), k=k
+            )
+            hits = [(doc.metadata["resume_id"], -distance) for doc, distance in results]
+        
+        best: Dict[str, float] = {}
+        for rid, score in hits:
+            if rid in self.resumes["resumes"] and score > best.get(rid, float("-inf")):
+                best[rid] = score
         
-        return [{"id": rid, **self.resumes["resumes"][rid]} 
-                for rid in resume_ids 
-                if rid in self.resumes["resumes"]]
+        ranked = sorted(best, key=best.get, reverse=True)[:n_results]
+        return [{"id": rid, **self.resumes["resumes"][rid]} for rid in ranked]
     
-    def match_job_description(self, job_description: str, top_n: int = 5) -> List[Dict]:
+    def match_job_description(self, job_description: str, top_n: int = 5, use_llm_score: bool = False) -> List[Dict]:
         """Find resumes that match a job description"""
-        # First use vector search to find potential matches
+        return asyncio.run(self.match_job_description_async(job_description, top_n, use_llm_score))
+    
+    async def match_job_description_async(self, job_description: str, top_n: int = 5,
+                                          use_llm_score: bool = False) -> List[Dict]:
+        """Find resumes that match a job description, scoring candidates concurrently"""
         try:
-            results = self.vector_store.similarity_search(job_description, k=10)
-            resume_ids = set([doc.metadata["resume_id"] for doc in results])
-            
-            # For each resume, calculate a more detailed match score
-            matches = []
-            for rid in resume_ids:
-                resume = self.get_resume(rid)
-                if resume:
-                    # Calculate match score using our LLM
-                    match_score = self._calculate_match_score(resume["summary"], job_description)
-                    matches.append({
-                        "id": rid,
-                        "summary": resume["summary"],
-                        "match_score": match_score,
-                        "metadata": resume["metadata"]
-                    })
+            # Rank every stored resume against the job description in one pass. The embedding model
+            # runs in a worker thread so it doesn't block the event loop
+            job_vec = self._normalize(await asyncio.to_thread(self.embeddings.embed_query, job_description))
+            top = self._top_matches(job_vec, LLM_RERANK_TOP_K if use_llm_score else top_n)
+            candidates = [(rid, self.get_resume(rid), score) for rid, score in top]
+            candidates = [(rid, resume, score) for rid, resume, score in candidates if resume]
+            
+            if use_llm_score:
+                # Candidates below the similarity floor keep their cosine score instead of costing an LLM call
+                to_score = [(rid, resume["summary"]) for rid, resume, score in candidates
+                            if score >= LLM_RERANK_MIN_SIMILARITY]
+                llm_scores = await self._calculate_match_scores_batch(to_score, job_description) if to_score else {}
+                
+                # Anything the batch answer missed is scored one at a time, no more at once
+                # than Ollama will run in parallel
+                semaphore = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
+                
+                async def bounded_score(summary: str) -> float:
+                    async with semaphore:
+                        return await self._calculate_match_score_async(summary, job_description)
+                
+                missing = [(rid, summary) for rid, summary in to_score if rid not in llm_scores]
+                retried = await asyncio.gather(*[bounded_score(summary) for _, summary in missing])
+                llm_scores.update(zip([rid for rid, _ in missing], retried))
+                scores = [llm_scores.get(rid, score) for rid, _, score in candidates]
+            else:
+                scores = [score for _, _, score in candidates]
+            
+            matches = [
+                {
+                    "id": rid,
+                    "summary": resume["summary"],
+                    "match_score": match_score,
+                    "metadata": resume["metadata"]
+                }
+                for (rid, resume, _), match_score in zip(candidates, scores)
+            ]
             
             # Sort by match score and return top N
             matches.sort(key=lambda x: x["match_score"], reverse=True)
@@ -129,38 +826,52 @@ class ResumeStore:
             print(f"Error matching job description: {e}")
             return []
     
-    def _calculate_match_score(self, resume_summary: str, job_description: str) -> float:
-        """Calculate how well a resume matches a job description"""
+    def _top_matches(self, job_vec: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        """Score all resumes with a single matrix-vector product and return the top k"""
+        job_i8, job_scale = self._quantize(job_vec)
+        # add_resume may grow or rewrite the matrix from another thread
+        with self._lock:
+            n = len(self._ids)
+            if n == 0 or k <= 0:
+                return []
+            k = min(k, n)
+            # int8 rows are accumulated in int32, then rescaled back to cosine similarity
+            scores = _dot_rows_i8(self._mat[:n], job_i8) * (self._scales[:n] * job_scale)
+            ids = self._ids[:n]
+        idx = np.argpartition(-scores, k - 1)[:k]
+        idx = idx[np.argsort(-scores[idx])]
+        return [(ids[i], float(scores[i])) for i in idx]
+    
+    async def _calculate_match_scores_batch(self, resumes: List[Tuple[str, str]], job_description: str) -> Dict[str, float]:
+        """Score (id, summary) pairs against a job description in one LLM call; unparseable entries are left out"""
         try:
-            # Use a simple prompt to get a match percentage
-            prompt = PromptTemplate(
-                input_variables=["resume", "job"],
-                template="""
-                You are evaluating how well a candidate's resume matches a job description.
-                
-                Resume:
-                {resume}
-                
-                Job Description:
-                {job}
-                
-                On a scale of 0 to 100, where 100 means perfect match and 0 means no match at all,
-                assign a score based on skills, experience, and qualifications match.
-                Return ONLY the numeric score without explanation.
-                """
-            )
+            payload = _json_dumps([{"id": rid, "summary": summary} for rid, summary in resumes])
+            result = await _get_llm_cache().arun(self._batch_match_chain, resumes=payload, job=job_description)
             
-            chain = LLMChain(llm=llm, prompt=prompt)
-            result = chain.run(resume=resume_summary, job=job_description)
+            match = self.JSON_ARRAY.search(result)
+            entries = _json_loads(match.group(0)) if match else []
+            wanted = {rid for rid, _ in resumes}
+            scores = {}
+            for entry in entries:
+                try:
+                    rid = str(entry["id"])
+                    score = _SCORE_RE.search(str(entry["score"]))
+                    if rid in wanted and score:
+                        scores[rid] = min(float(score.group(1)), 100) / 100
+                except (KeyError, TypeError):
+                    continue
+            return scores
+        except Exception as e:
+            print(f"Error calculating batch match scores: {e}")
+            return {}
+    
+    async def _calculate_match_score_async(self, resume_summary: str, job_description: str) -> float:
+        """Calculate how well a resume matches a job description using the LLM"""
+        try:
+            result = await _get_llm_cache().arun(self._match_chain, resume=resume_summary, job=job_description)
             
-            # Extract numeric score
-            try:
-                # Clean the result and extract just the number
-                cleaned_result = result.strip().replace('%', '')
-                return float(cleaned_result) / 100
-            except ValueError:
-                # If we can't parse a number, default to 0
-                return 0
+            # Extract numeric score; if we can't find a number, default to 0
+            return _parse_score(result)
         except Exception as e:
             print(f"Error calculating match score: {e}")
             return 0
@@ -170,39 +881,37 @@ class ResumeStore:
         if resume_id not in self.resumes["resumes"]:
             return False
         
-        # Initialize feedback array if it doesn't exist
-        if "feedback" not in self.resumes["resumes"][resume_id]:
-            self.resumes["resumes"][resume_id]["feedback"] = []
-        
-        # Add the feedback
-        self.resumes["resumes"][resume_id]["feedback"].append({
-            "timestamp": time.time(),
-            "is_positive": is_positive,
-            "text": feedback_text
-        })
-        
-        self._save_db()
+        with self._lock:
+            # Initialize feedback array if it doesn't exist
+            if "feedback" not in self.resumes["resumes"][resume_id]:
+                self.resumes["resumes"][resume_id]["feedback"] = []
+            
+            # Add the feedback
+            timestamp = time.time()
+            self.resumes["resumes"][resume_id]["feedback"].append({
+                "timestamp": timestamp,
+                "is_positive": is_positive,
+                "text": feedback_text
+            })
+            
+            self._conn.execute(
+                "INSERT INTO feedback (resume_id, ts, is_positive, text) VALUES (?, ?, ?, ?)",
+                (resume_id, timestamp, int(is_positive), feedback_text)
+            )
+            
+            if is_positive:
+                self._fb_pos += 1
+            else:
+                self._fb_neg += 1
+            self._fb_resumes.add(resume_id)
         return True
 
     def get_feedback_stats(self):
         """Get statistics on feedback across all resumes"""
-        total_positive = 0
-        total_negative = 0
-        resume_count = 0
-        
-        for resume_id, resume_data in self.resumes["resumes"].items():
-            if "feedback" in resume_data:
-                resume_count += 1
-                for feedback in resume_data["feedback"]:
-                    if feedback["is_positive"]:
-                        total_positive += 1
-                    else:
-                        total_negative += 1
-        
         return {
-            "total_positive": total_positive,
-            "total_negative": total_negative,
-            "resume_count_with_feedback": resume_count,
+            "total_positive": self._fb_pos,
+            "total_negative": self._fb_neg,
+            "resume_count_with_feedback": len(self._fb_resumes),
             "total_resume_count": len(self.resumes["resumes"])
         }
 
@@ -237,20 +946,34 @@ class ResumeComparatorAgent:
         if len(resume_ids) < 2:
             return "Need at least 2 resumes to compare"
             
-        resume_summaries = []
-        for rid in resume_ids:
-            resume = self.resume_store.get_resume(rid)
-            if resume:
-                resume_summaries.append(f"Resume ID: {rid}\n{resume['summary']}")
+        resume_summaries = self.resume_store.summaries_block(resume_ids, "Resume ID")
         
         if not resume_summaries:
             return "No valid resumes found to compare"
         
         try:
-            result = self.compare_chain.run(resume_summaries="\n\n---\n\n".join(resume_summaries))
+            result = _get_llm_cache().run(self.compare_chain, resume_summaries=resume_summaries)
             return result
         except Exception as e:
             return f"Error comparing resumes: {str(e)}"
+    
+    async def stream_comparison(self, resume_ids: List[str]) -> AsyncIterator[str]:
+        """Compare multiple resumes by ID, yielding the comparison as it is generated"""
+        if len(resume_ids) < 2:
+            yield "Need at least 2 resumes to compare"
+            return
+        
+        resume_summaries = self.resume_store.summaries_block(resume_ids, "Resume ID")
+        
+        if not resume_summaries:
+            yield "No valid resumes found to compare"
+            return
+        
+        try:
+            async for token in _get_llm_cache().astream(self.compare_chain, resume_summaries=resume_summaries):
+                yield token
+        except Exception as e:
+            yield f"Error comparing resumes: {str(e)}"
 
 
 class SkillGapIdentifierAgent:
@@ -291,7 +1014,8 @@ class SkillGapIdentifierAgent:
             return "Resume not found"
         
         try:
-            result = self.gap_chain.run(
+            result = _get_llm_cache().run(
+                self.gap_chain,
                 job_description=job_description,
                 resume_summary=resume["summary"]
             )
@@ -335,28 +1059,49 @@ class CandidateRankerAgent:
         if not resume_ids:
             return "No resumes provided for ranking"
             
-        resume_summaries = []
-        for rid in resume_ids:
-            resume = self.resume_store.get_resume(rid)
-            if resume:
-                resume_summaries.append(f"Candidate ID: {rid}\n{resume['summary']}")
+        resume_summaries = self.resume_store.summaries_block(resume_ids, "Candidate ID")
         
         if not resume_summaries:
             return "No valid resumes found to rank"
         
         try:
-            result = self.rank_chain.run(
+            result = _get_llm_cache().run(
+                self.rank_chain,
                 job_description=job_description,
-                resume_summaries="\n\n---\n\n".join(resume_summaries)
+                resume_summaries=resume_summaries
             )
             return result
         except Exception as e:
             return f"Error ranking candidates: {str(e)}"
+    
+    async def stream_ranking(self, resume_ids: List[str], job_description: str) -> AsyncIterator[str]:
+        """Rank candidates based on job fit, yielding the ranking as it is generated"""
+        if not resume_ids:
+            yield "No resumes provided for ranking"
+            return
+        
+        resume_summaries = self.resume_store.summaries_block(resume_ids, "Candidate ID")
+        
+        if not resume_summaries:
+            yield "No valid resumes found to rank"
+            return
+        
+        try:
+            async for token in _get_llm_cache().astream(
+                self.rank_chain,
+                job_description=job_description,
+                resume_summaries=resume_summaries
+            ):
+                yield token
+        except Exception as e:
+            yield f"Error ranking candidates: {str(e)}"
         
         
 class QuestionGeneratorAgent:
     """Agent that generates follow-up questions for ambiguous resumes"""
     
+    JSON_ARRAY = re.compile(r"\[[\s\S]*\]")
+    
     def __init__(self):
         self.llm = llm
         
@@ -386,12 +1131,12 @@ class QuestionGeneratorAgent:
             return ["Resume not found"]
         
         try:
-            result = self.question_chain.run(resume_summary=resume["summary"])
+            result = _get_llm_cache().run(self.question_chain, resume_summary=resume["summary"])
             
-            # Try to parse JSON response
+            # Try to parse JSON response, ignoring any prose the model wraps around the array
             try:
-                import json
-                questions = json.loads(result)
+                match = self.JSON_ARRAY.search(result)
+                questions = _json_loads(match.group(0) if match else result)
                 if isinstance(questions, list):
                     return questions
                 return ["Error parsing questions"]
@@ -406,6 +1151,9 @@ class QuestionGeneratorAgent:
 class FakeResumeDetectorAgent:
     """Agent that detects potentially fake or AI-written resumes"""
     
+    SENTENCE_SPLIT = re.compile(r"[.!?]+\s+|\n+")
+    WORD = re.compile(r"[A-Za-z0-9']+")
+    
     def __init__(self):
         self.llm = llm
         
@@ -436,15 +1184,39 @@ class FakeResumeDetectorAgent:
         
         self.detector_chain = LLMChain(llm=self.llm, prompt=self.detector_prompt)
     
+    def _cheap_screen(self, text: str) -> float:
+        """Score from 0 (reads human) to 1 (reads generated) using burstiness and 3-gram reuse"""
+        words = [w.lower() for w in self.WORD.findall(text)]
+        lengths = np.array([len(self.WORD.findall(s)) for s in self.SENTENCE_SPLIT.split(text)], dtype=np.float32)
+        lengths = lengths[lengths > 0]
+        if len(lengths) < 5 or len(words) < 50:
+            return 0.5  # Too little text to judge, leave it to the LLM
+        
+        # Generated text tends to have evenly sized sentences and recycled phrasing
+        burstiness = float(lengths.std() / lengths.mean())
+        trigrams = list(zip(words, words[1:], words[2:]))
+        uniqueness = len(set(trigrams)) / len(trigrams)
+        return float(np.clip(0.7 * (1 - burstiness) + 0.3 * (1 - uniqueness), 0, 1))
+    
     def detect_fake_resume(self, resume_text: str) -> Dict:
         """Analyze a resume for signs of being fake or AI-generated"""
+        # Skip the LLM only for text that clearly reads human. The heuristic is too rough to flag a
+        # resume on its own (terse, bullet-heavy resumes score high too), so high scores still go to the LLM
+        score = self._cheap_screen(resume_text)
+        if score < FAKE_SCREEN_HUMAN_MAX:
+            return {
+                "is_suspicious": False,
+                "confidence_score": round(score * 100),
+                "reasons": ["Sentence lengths and phrasing vary the way human writing does"],
+                "red_flags": []
+            }
+        
         try:
-            result = self.detector_chain.run(resume_text=resume_text)
+            result = _get_llm_cache().run(self.detector_chain, resume_text=resume_text)
             
             # Try to parse JSON response
             try:
-                import json
-                analysis = json.loads(result)
+                analysis = _json_loads(result)
                 return analysis
             except:
                 # If JSON parsing fails, return a basic response
@@ -464,8 +1236,27 @@ class FakeResumeDetectorAgent:
             }
 
 
+def warm_up_llm():
+    """Load the models into memory now so the first real request doesn't pay for it"""
+    global fast_llm
+    try:
+        llm.invoke("ok", num_predict=1)
+    except Exception as e:
+        print(f"Warning: could not warm up Ollama model {DEFAULT_MODEL}: {e}")
+        return
+    if FAST_MODEL == DEFAULT_MODEL:
+        return
+    try:
+        fast_llm.invoke("ok", num_predict=1)
+    except Exception as e:
+        # Ollama is up, so the fast model is most likely not pulled; score with the default model instead
+        print(f"Warning: fast model {FAST_MODEL} is unavailable, using {DEFAULT_MODEL} instead: {e}")
+        fast_llm = llm
+
+
 def setup_agents():
     """Initialize and return the resume store and agents"""
+    warm_up_llm()
     resume_store = ResumeStore()
     comparator_agent = ResumeComparatorAgent(resume_store)
     gap_identifier_agent = SkillGapIdentifierAgent(resume_store)
@@ -1,9 +1,9 @@
 import os
 import tempfile
 import shutil
-import uuid
 from fastapi import FastAPI, UploadFile, File, HTTPException, BackgroundTasks, Form
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List
 import uvicorn
@@ -32,6 +32,7 @@ UPLOAD_DIR = Path("./uploads")
 SUPPORTED_EXTENSIONS = {".pdf", ".docx", ".txt"}
 DEFAULT_MODEL = "llama3"
 REQUEST_TIMEOUT = 30
+UPLOAD_BUFFER_SIZE = 1 << 20  # 1 MB reads/writes when saving uploads
 
 # Create upload directory if it doesn't exist
 UPLOAD_DIR.mkdir(exist_ok=True)
@@ -61,6 +62,11 @@ class FeedbackRequest(BaseModel):
 def is_valid_file_type(filename: str) -> bool:
     return Path(filename).suffix.lower() in SUPPORTED_EXTENSIONS
 
+def save_upload(file: UploadFile, file_path: Path):
+    """Copy an uploaded file to disk in large chunks"""
+    with open(file_path, "wb", buffering=UPLOAD_BUFFER_SIZE) as buffer:
+        shutil.copyfileobj(file.file, buffer, length=UPLOAD_BUFFER_SIZE)
+
 # Initialize components
 file_extractor = FileExtractor()
 resume_validator = ResumeValidator()
@@ -89,8 +95,7 @@ async def upload_resume(file: UploadFile = File(...)):
     
     # Save the uploaded file
     try:
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        await asyncio.to_thread(save_upload, file, file_path)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
     
@@ -108,7 +113,7 @@ async def summarize_resume(request: SummaryRequest, background_tasks: Background
     
     try:
         # Extract text
-        text = file_extractor.extract_text(file_path)
+        text = await asyncio.to_thread(file_extractor.extract_text, file_path)
         
         if not text.strip():
             raise HTTPException(status_code=400, detail="No text found in document")
@@ -123,10 +128,10 @@ async def summarize_resume(request: SummaryRequest, background_tasks: Background
             )
         
         # Generate summary
-        summary = ollama_client.summarize_resume(text, request.model)
+        summary = await asyncio.to_thread(ollama_client.summarize_resume, text, request.model)
         
         # Store the resume in our database
-        resume_store.add_resume(request.file_id, text, summary)
+        await asyncio.to_thread(resume_store.add_resume, request.file_id, text, summary)
         
         # Schedule file cleanup (optional, comment out if you want to keep files)
         # background_tasks.add_task(cleanup_file, file_path)
@@ -154,16 +159,24 @@ async def compare_resumes(request: CompareRequest):
     if len(request.resume_ids) < 2:
         raise HTTPException(status_code=400, detail="Need at least 2 resumes to compare")
     
-    comparison = comparator_agent.compare_resumes(request.resume_ids)
+    comparison = await asyncio.to_thread(comparator_agent.compare_resumes, request.resume_ids)
     return {"comparison": comparison}
 
+@app.post("/compare/stream")
+async def stream_compare_resumes(request: CompareRequest):
+    """Compare multiple resumes, streaming the comparison text as it is generated"""
+    if len(request.resume_ids) < 2:
+        raise HTTPException(status_code=400, detail="Need at least 2 resumes to compare")
+    
+    return StreamingResponse(comparator_agent.stream_comparison(request.resume_ids), media_type="text/plain")
+
 @app.post("/identify-gaps")
 async def identify_gaps(request: JobDescriptionRequest):
     """Identify skill gaps for a specific job"""
     if len(request.resume_ids) != 1:
         raise HTTPException(status_code=400, detail="Please provide exactly one resume ID")
     
-    analysis = gap_identifier_agent.identify_gaps(request.resume_ids[0], request.job_description)
+    analysis = await asyncio.to_thread(gap_identifier_agent.identify_gaps, request.resume_ids[0], request.job_description)
     return {"gap_analysis": analysis}
 
 @app.post("/rank-candidates")
@@ -172,13 +185,24 @@ async def rank_candidates(request: JobDescriptionRequest):
     if len(request.resume_ids) < 2:
         raise HTTPException(status_code=400, detail="Need at least 2 resumes to rank")
     
-    ranking = ranker_agent.rank_candidates(request.resume_ids, request.job_description)
+    ranking = await asyncio.to_thread(ranker_agent.rank_candidates, request.resume_ids, request.job_description)
     return {"ranking": ranking}
 
+@app.post("/rank-candidates/stream")
+async def stream_rank_candidates(request: JobDescriptionRequest):
+    """Rank candidates for a specific job, streaming the ranking text as it is generated"""
+    if len(request.resume_ids) < 2:
+        raise HTTPException(status_code=400, detail="Need at least 2 resumes to rank")
+    
+    return StreamingResponse(
+        ranker_agent.stream_ranking(request.resume_ids, request.job_description),
+        media_type="text/plain"
+    )
+
 @app.post("/search-resumes")
 async def search_resumes(query: str = Form(...), n_results: int = Form(5)):
     """Search resumes by semantic similarity"""
-    results = resume_store.search_resumes(query, n_results)
+    results = await asyncio.to_thread(resume_store.search_resumes, query, n_results)
     return {"results": results}
 
 @app.post("/upload-job-description")
@@ -187,23 +211,13 @@ async def upload_job_description(file: UploadFile = File(...)):
     if not file:
         raise HTTPException(status_code=400, detail="No file provided")
     
-    # Create a unique file ID and save path
-    file_id = f"job_{uuid.uuid4().hex}"
-    file_path = UPLOAD_DIR / f"{file_id}_{file.filename}"
-    
-    # Save the uploaded file
     try:
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-            
-        # Extract text from the job description
-        text = file_extractor.extract_text(file_path)
-        
-        # Clean up the file
-        os.remove(file_path)
+        # Extract text from the job description straight from the upload, without a temp file
+        data = await file.read()
+        text = await asyncio.to_thread(file_extractor.extract_text_from_bytes, data, Path(file.filename).suffix)
         
         # Find matching resumes
-        matching_results = resume_store.match_job_description(text)
+        matching_results = await resume_store.match_job_description_async(text)
         
         return {
             "job_description": text,
@@ -215,7 +229,7 @@ async def upload_job_description(file: UploadFile = File(...)):
 @app.get("/generate-questions/{resume_id}")
 async def generate_questions(resume_id: str):
     """Generate follow-up questions for ambiguous parts of a resume"""
-    questions = question_agent.generate_questions(resume_id, resume_store)
+    questions = await asyncio.to_thread(question_agent.generate_questions, resume_id, resume_store)
     return {"questions": questions}
 
 @app.post("/detect-fake-resume")
@@ -230,22 +244,13 @@ async def detect_fake_resume(file: UploadFile = File(...)):
             detail=f"Unsupported file type. Supported types: {', '.join(SUPPORTED_EXTENSIONS)}"
         )
     
-    # Create a temp file
-    file_id = f"temp_{uuid.uuid4().hex}"
-    file_path = UPLOAD_DIR / f"{file_id}_{file.filename}"
-    
     try:
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-            
-        # Extract text
-        text = file_extractor.extract_text(file_path)
+        # Extract text straight from the upload, without a temp file
+        data = await file.read()
+        text = await asyncio.to_thread(file_extractor.extract_text_from_bytes, data, Path(file.filename).suffix)
         
         # Analyze for fake content
-        analysis = fake_detector_agent.detect_fake_resume(text)
-        
-        # Clean up the file
-        os.remove(file_path)
+        analysis = await asyncio.to_thread(fake_detector_agent.detect_fake_resume, text)
         
         return analysis
     except Exception as e:
@@ -271,6 +276,17 @@ async def get_feedback_stats():
     stats = resume_store.get_feedback_stats()
     return stats
 
+@app.post("/flush")
+async def flush_store():
+    """Write pending vector data to disk now instead of waiting for the next checkpoint"""
+    await asyncio.to_thread(resume_store.persist)
+    return {"status": "success"}
+
+@app.on_event("shutdown")
+def flush_on_shutdown():
+    """Flush vector data before the server exits"""
+    resume_store.persist()
+
 def cleanup_file(file_path: Path):
     """Remove uploaded file after processing"""
     try:
@@ -1,20 +1,36 @@
 import argparse
-import fitz  # PyMuPDF
-import docx
-import requests
+# fitz (PyMuPDF), lxml and requests are imported where they are used, so only the parser
+# needed for the input format is loaded and .txt validation starts instantly
+import zipfile
+import io
+import json
 import os
 import logging
 import re
 import time
+import asyncio
+import hashlib
+import sqlite3
+import threading
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 import sys
 
+try:
+    import re2 as re_engine  # google-re2: linear-time matching for the validator's section checks
+except ImportError:
+    re_engine = re
+
 # Configuration
 OLLAMA_ENDPOINT = os.getenv("OLLAMA_ENDPOINT", "http://localhost:11434/api/generate")
 SUPPORTED_EXTENSIONS = {".pdf", ".docx", ".txt"}
 REQUEST_TIMEOUT = 30
 MAX_RETRIES = 2
+MAX_PDF_PAGES = 10  # Resumes are rarely longer; later pages are not extracted
+MAX_CONCURRENT_REQUESTS = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))  # Match Ollama's parallel request limit
+HTTP_POOL_SIZE = 16  # Keep-alive connections to Ollama shared by concurrent requests
+SUMMARY_CACHE_PATH = os.getenv("RESUME_ANALYZER_CACHE", str(Path.home() / ".cache" / "resume_analyzer" / "summaries.db"))
+SUMMARY_CACHE_TTL = 7 * 24 * 3600  # Seconds a cached summary stays valid
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -27,53 +43,129 @@ class ResumeAnalyzerError(Exception):
 class FileExtractor:
     """Handles text extraction from different file formats"""
     
+    @staticmethod
+    def _pdf_text(doc, max_pages: int = MAX_PDF_PAGES) -> str:
+        """Concatenate page text one page at a time, up to max_pages pages"""
+        if doc.page_count > max_pages:
+            logger.warning(f"PDF has {doc.page_count} pages; only the first {max_pages} are extracted")
+        buf = io.StringIO()
+        for i in range(min(doc.page_count, max_pages)):
+            if i:
+                buf.write("\n")
+            buf.write(doc[i].get_text("text"))
+        return buf.getvalue()
+    
     @staticmethod
     def extract_text_from_pdf(file_path: Path) -> str:
         try:
-            doc = fitz.open(file_path)
-            text = "\n".join([page.get_text() for page in doc])
-            doc.close()
-            return text
+            import fitz  # PyMuPDF
+            with fitz.open(file_path) as doc:
+                return FileExtractor._pdf_text(doc)
         except Exception as e:
             raise ResumeAnalyzerError(f"Failed to extract text from PDF: {e}")
 
+    # WordprocessingML names used to read body paragraphs straight from document.xml
+    _W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+    _DOCX_RUN_TEXT = {_W + "tab": "\t", _W + "ptab": "\t", _W + "cr": "\n", _W + "noBreakHyphen": "-"}
+    
+    @staticmethod
+    def _docx_text(source) -> str:
+        """Body paragraph text of a .docx (path or file object), read without building python-docx objects
+
+        Like python-docx's Document.paragraphs, tables and text boxes are left out; the v4 script's
+        extract_text_from_docx reads the same paragraphs, so both give the same text for a file
+        """
+        from lxml import etree
+        w = FileExtractor._W
+        with zipfile.ZipFile(source) as archive:
+            # Uploaded files are untrusted: never expand entities or fetch external DTDs (as python-docx)
+            parser = etree.XMLParser(resolve_entities=False, no_network=True)
+            root = etree.fromstring(archive.read("word/document.xml"), parser)
+        body = root.find(w + "body")
+        if body is None:
+            return ""
+        
+        # Same text python-docx's Paragraph.text gives: runs and hyperlinked runs, with tabs and breaks
+        # Written straight into one buffer rather than per-paragraph strings plus a final join
+        buf = io.StringIO()
+        for i, para in enumerate(body.iterchildren(w + "p")):
+            if i:
+                buf.write("\n")
+            for run in para.iterchildren(w + "r", w + "hyperlink"):
+                runs = run.iterchildren(w + "r") if run.tag == w + "hyperlink" else (run,)
+                for r in runs:
+                    for el in r.iterchildren():
+                        if el.tag == w + "t":
+                            buf.write(el.text or "")
+                        elif el.tag == w + "br":
+                            buf.write("\n" if el.get(w + "type", "textWrapping") == "textWrapping" else "")
+                        else:
+                            buf.write(FileExtractor._DOCX_RUN_TEXT.get(el.tag, ""))
+        return buf.getvalue()
+    
     @staticmethod
     def extract_text_from_docx(file_path: Path) -> str:
         try:
-            doc = docx.Document(file_path)
-            return "\n".join([para.text for para in doc.paragraphs])
+            return FileExtractor._docx_text(file_path)
         except Exception as e:
             raise ResumeAnalyzerError(f"Failed to extract text from DOCX: {e}")
 
     @staticmethod
-    def extract_text_from_txt(file_path: Path) -> str:
+    def _decode_text(data: bytes) -> str:
+        """Decode a whole text file in one pass, normalizing newlines as text-mode open() would"""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return f.read()
+            text = data.decode("utf-8")
         except UnicodeDecodeError:
             # Fallback to different encoding
-            try:
-                with open(file_path, "r", encoding="latin-1") as f:
-                    return f.read()
-            except Exception as e:
-                raise ResumeAnalyzerError(f"Failed to read text file: {e}")
+            text = data.decode("latin-1")
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+    
+    @staticmethod
+    def extract_text_from_txt(file_path: Path) -> str:
+        try:
+            return FileExtractor._decode_text(file_path.read_bytes())
         except Exception as e:
             raise ResumeAnalyzerError(f"Failed to extract text from TXT: {e}")
 
+    # Extension dispatch built once; __func__ unwraps the staticmethods defined above
+    _EXTRACTORS = {
+        ".pdf": extract_text_from_pdf.__func__,
+        ".docx": extract_text_from_docx.__func__,
+        ".txt": extract_text_from_txt.__func__
+    }
+    
     def extract_text(self, file_path: Path) -> str:
         """Extract text based on file extension"""
         extension = file_path.suffix.lower()
         
-        extractors = {
-            ".pdf": self.extract_text_from_pdf,
-            ".docx": self.extract_text_from_docx,
-            ".txt": self.extract_text_from_txt
-        }
-        
-        if extension not in extractors:
+        extractor = self._EXTRACTORS.get(extension)
+        if extractor is None:
             raise ResumeAnalyzerError(f"Unsupported file format: {extension}")
         
-        return extractors[extension](file_path)
+        return extractor(file_path)
+
+    def extract_text_from_bytes(self, data: bytes, suffix: str) -> str:
+        """Extract text from an in-memory file, choosing the format by extension"""
+        extension = suffix.lower()
+        
+        if extension == ".pdf":
+            try:
+                import fitz  # PyMuPDF
+                with fitz.open(stream=data, filetype="pdf") as doc:
+                    return self._pdf_text(doc)
+            except Exception as e:
+                raise ResumeAnalyzerError(f"Failed to extract text from PDF: {e}")
+        if extension == ".docx":
+            try:
+                return self._docx_text(io.BytesIO(data))
+            except Exception as e:
+                raise ResumeAnalyzerError(f"Failed to extract text from DOCX: {e}")
+        if extension == ".txt":
+            return self._decode_text(data)
+        
+        raise ResumeAnalyzerError(f"Unsupported file format: {extension}")
 
 class ResumeValidator:
     """Validates if a document is likely a resume"""
@@ -109,70 +201,94 @@ class ResumeValidator:
         r"agile", r"scrum", r"jira", r"git", r"linux", r"windows", r"database"
     ]
     
+    # Patterns compiled once at class load, case-insensitive so the text needn't be lowercased
+    # Section patterns use only word boundaries and literals, so they can run on RE2
+    _SECTION_RES = [re_engine.compile(rf"(?i)\b{pattern}\b") for pattern in RESUME_SECTIONS]
+    # Date patterns overlap ("Jan 2019 - Present" is a month and a range), and each one's matches are
+    # counted on their own, so they stay separate patterns rather than one alternation
+    _DATE_RES = [re.compile(pattern, re.IGNORECASE) for pattern in DATE_PATTERNS]
+    
+    # Sections include multi-word headers, so they share one alternation, longest first
+    _SECTIONS_RE = re.compile(
+        r"\b(?:" + "|".join(sorted(RESUME_SECTIONS, key=len, reverse=True)) + r")\b", re.IGNORECASE
+    )
+    
+    # Job titles and tech terms are single words, so they are looked up in the document's token set
+    _TOKEN_RE = re.compile(r"[a-z0-9+#]+", re.IGNORECASE)
+    _JOB_TITLE_SET = frozenset(JOB_TITLES)
+    _TECH_TERM_SET = frozenset(term.replace("\\", "") for term in TECH_TERMS)
+    
+    # Points awarded per category, indexed by match count (capped at the last entry)
+    _SECTION_POINTS = (0, 20, 20, 40)
+    _JOB_POINTS = (0, 10, 20)
+    _DATE_POINTS = (0, 10, 10, 20)
+    _TECH_POINTS = (0, 0, 10, 10, 10, 20)
+    
+    @staticmethod
+    def _count_terms(combined, patterns: list, text: str) -> int:
+        """Count the distinct patterns present in text, scanning it once with the combined regex"""
+        if re_engine is not re:
+            # RE2 finds a first match far faster than re but pays per match in findall,
+            # so with RE2 each pattern is just tested for presence
+            return sum(1 for pat in patterns if pat.search(text))
+        found = set(combined.findall(text))
+        # A match such as "professional experience" also counts the patterns it contains
+        return sum(1 for pat in patterns if any(pat.search(match) for match in found))
+    
     @classmethod
-    def is_resume(cls, text: str) -> Tuple[bool, float, str]:
+    def is_resume(cls, text: str, fast: bool = True) -> Tuple[bool, float, str]:
         """
         Check if the document is likely a resume
+        With fast, scoring stops once the document passes, so confidence is a lower bound
         Returns: (is_resume, confidence_score, explanation)
         """
         if not text or len(text.strip()) < 200:
             return False, 0, "Document is too short to be a resume"
         
-        text_lower = text.lower()
-        
         # Score calculation based on patterns found
         score = 0
         explanation = []
         
         # Check for resume sections
-        section_matches = 0
-        for pattern in cls.RESUME_SECTIONS:
-            if re.search(rf"\b{pattern}\b", text_lower):
-                section_matches += 1
+        section_matches = cls._count_terms(cls._SECTIONS_RE, cls._SECTION_RES, text)
         
-        if section_matches >= 3:
-            score += 40
-            explanation.append(f"Found {section_matches} resume sections")
-        elif section_matches >= 1:
-            score += 20
+        points = cls._SECTION_POINTS[min(section_matches, 3)]
+        score += points
+        if points:
             explanation.append(f"Found {section_matches} resume sections")
         
         # Check for job titles
-        job_matches = 0
-        for pattern in cls.JOB_TITLES:
-            if re.search(rf"\b{pattern}\b", text_lower):
-                job_matches += 1
+        tokens = {token.lower() for token in cls._TOKEN_RE.findall(text)}
+        job_matches = len(cls._JOB_TITLE_SET & tokens)
         
-        if job_matches >= 2:
-            score += 20
-            explanation.append(f"Found {job_matches} job titles")
-        elif job_matches >= 1:
-            score += 10
+        points = cls._JOB_POINTS[min(job_matches, 2)]
+        score += points
+        if points:
             explanation.append(f"Found {job_matches} job titles")
         
+        # The verdict can't change once the threshold is reached
+        if fast and score >= 50:
+            return True, score / 100, ", ".join(explanation)
+        
         # Check for date patterns (work history)
-        date_matches = 0
-        for pattern in cls.DATE_PATTERNS:
-            date_matches += len(re.findall(pattern, text_lower))
+        # Counted straight off the match iterators, without building a list of matches per pattern
+        date_matches = sum(1 for pat in cls._DATE_RES for _ in pat.finditer(text))
         
-        if date_matches >= 3:
-            score += 20
-            explanation.append(f"Found {date_matches} date patterns")
-        elif date_matches >= 1:
-            score += 10
+        points = cls._DATE_POINTS[min(date_matches, 3)]
+        score += points
+        if points:
             explanation.append(f"Found {date_matches} date patterns")
         
+        # The verdict can't change once the threshold is reached
+        if fast and score >= 50:
+            return True, score / 100, ", ".join(explanation)
+        
         # Check for technical terms
-        tech_matches = 0
-        for pattern in cls.TECH_TERMS:
-            if re.search(rf"\b{pattern}\b", text_lower):
-                tech_matches += 1
+        tech_matches = len(cls._TECH_TERM_SET & tokens)
         
-        if tech_matches >= 5:
-            score += 20
-            explanation.append(f"Found {tech_matches} technical terms")
-        elif tech_matches >= 2:
-            score += 10
+        points = cls._TECH_POINTS[min(tech_matches, 5)]
+        score += points
+        if points:
             explanation.append(f"Found {tech_matches} technical terms")
         
         # Calculate confidence as percentage
@@ -184,14 +300,60 @@ class ResumeValidator:
         explanation_text = ", ".join(explanation)
         return is_resume, confidence, explanation_text
     
+# Fixed instructions placed before the resume text in every summary prompt
+_PROMPT_PREAMBLE = """
+You are an expert resume analyst helping recruiters and interviewers quickly assess candidates.
+Extract and summarize the key information from the resume below.
+Use clear formatting with headings, bullet points, and emojis for better readability.
+Focus only on professional qualifications and skills.
+Ignore personal details like address, phone number, etc.
+
+⚠️ IMPORTANT INSTRUCTION: Under NO circumstances include high school, secondary school, or non-college education in your summary. ONLY include the single highest degree (Bachelor's, Master's, PhD).
+
+Create a comprehensive professional summary including:
+
+📋 PROFILE:
+- Years of experience + current role
+- 1-2 sentence overview of candidate background
+
+💻 SKILLS:
+- List ONLY the most important technical skills (max 2-5)
+- Group related skills together (max 2-5)
+
+🏢 EXPERIENCE:
+- Current/most recent company and role (with dates)
+- Previous roles with company names and timeframes
+- Max 2-3 responsibilities and notable achievements in each role
+
+🚀 PROJECTS:
+- 1-3 notable projects with very brief descriptions
+- Focus on technical complexity and impact
+
+🎓 EDUCATION:
+- ONLY include the single highest academic degree (bachelor's, master's, etc.)
+- Do NOT include high school, secondary education, or multiple degrees
+- Only add certifications if they are technical or professional certifications
+
+Resume Content:
+"""
+
 class OllamaClient:
     """Handles communication with Ollama API"""
     
     def __init__(self, endpoint: str = OLLAMA_ENDPOINT, timeout: int = REQUEST_TIMEOUT):
+        import requests
         self.endpoint = endpoint
         self.timeout = timeout
+        # One pooled session, so repeated calls reuse connections instead of reconnecting
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
     
-    def summarize_resume(self, text: str, model: str, retries: int = MAX_RETRIES) -> str:
+    def summarize_resume(self, text: str, model: str, retries: int = MAX_RETRIES,
+                         on_token: Optional[Callable[[str], None]] = None) -> str:
+        """Stream the summary from Ollama, passing each piece to on_token as it arrives"""
+        import requests
         if not text.strip():
             raise ResumeAnalyzerError("Resume text is empty")
         
@@ -202,22 +364,46 @@ class OllamaClient:
         while attempt <= retries:
             try:
                 # logger.info(f"Sending request to Ollama (attempt {attempt+1}/{retries+1})")
-                response = requests.post(
+                with self.session.post(
                     self.endpoint,
                     json={
                         "model": model,
                         "prompt": prompt,
-                        "stream": False
+                        "stream": True
                     },
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-                
-                result = response.json()
-                if "response" not in result:
-                    raise ResumeAnalyzerError("Invalid response format from Ollama")
+                    timeout=self.timeout,
+                    stream=True
+                ) as response:
+                    response.raise_for_status()
+                    
+                    # Ollama sends one JSON object per line until "done"
+                    parts = []
+                    try:
+                        for line in response.iter_lines():
+                            if not line:
+                                continue
+                            chunk = json.loads(line)
+                            if "error" in chunk:
+                                raise ResumeAnalyzerError(f"Ollama error: {chunk['error']}")
+                            if "response" not in chunk:
+                                raise ResumeAnalyzerError("Invalid response format from Ollama")
+                            parts.append(chunk["response"])
+                            if on_token:
+                                on_token(chunk["response"])
+                            if chunk.get("done"):
+                                break
+                    except requests.exceptions.ConnectionError as e:
+                        # requests reports a stall in the middle of the stream as ConnectionError.
+                        # Tokens already passed to on_token can't be taken back, so only retry
+                        # from the start if the caller hasn't seen any yet
+                        if on_token and parts:
+                            raise ResumeAnalyzerError(
+                                "Ollama stopped responding partway through the summary. "
+                                "Try again or increase the timeout with --timeout option."
+                            )
+                        raise requests.exceptions.ReadTimeout(e) from e
                 
-                return result["response"]
+                return "".join(parts)
                 
             except requests.exceptions.Timeout:
                 attempt += 1
@@ -233,55 +419,71 @@ class OllamaClient:
                 raise ResumeAnalyzerError("Cannot connect to Ollama. Is it running?")
             except requests.exceptions.RequestException as e:
                 raise ResumeAnalyzerError(f"API request failed: {e}")
+            except ResumeAnalyzerError:
+                raise
             except Exception as e:
                 raise ResumeAnalyzerError(f"Unexpected error: {e}")
     
     def _build_prompt(self, text: str) -> str:
         """Build a comprehensive resume analysis prompt"""
-        
-        return """
-You are an expert resume analyst helping recruiters and interviewers quickly assess candidates.
-Extract and summarize the key information from the resume below.
-Use clear formatting with headings, bullet points, and emojis for better readability.
-Focus only on professional qualifications and skills.
-Ignore personal details like address, phone number, etc.
+        # The preamble is a fixed prefix, so Ollama can reuse its cached prompt tokens across resumes
+        return _PROMPT_PREAMBLE + text
 
-⚠️ IMPORTANT INSTRUCTION: Under NO circumstances include high school, secondary school, or non-college education in your summary. ONLY include the single highest degree (Bachelor's, Master's, PhD).
-
-Create a comprehensive professional summary including:
-
-📋 PROFILE:
-- Years of experience + current role
-- 1-2 sentence overview of candidate background
-
-💻 SKILLS:
-- List ONLY the most important technical skills (max 2-5)
-- Group related skills together (max 2-5)
-
-🏢 EXPERIENCE:
-- Current/most recent company and role (with dates)
-- Previous roles with company names and timeframes
-- Max 2-3 responsibilities and notable achievements in each role
-
-🚀 PROJECTS:
-- 1-3 notable projects with very brief descriptions
-- Focus on technical complexity and impact
-
-🎓 EDUCATION:
-- ONLY include the single highest academic degree (bachelor's, master's, etc.)
-- Do NOT include high school, secondary education, or multiple degrees
-- Only add certifications if they are technical or professional certifications
-
-Resume Content:
-""" + text
+class SummaryCache:
+    """Summaries stored on disk (SQLite), keyed on file content, model and prompt"""
+    
+    def __init__(self, path: str = SUMMARY_CACHE_PATH, ttl: int = SUMMARY_CACHE_TTL):
+        self.ttl = ttl
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS summaries (key TEXT PRIMARY KEY, summary TEXT, created REAL)")
+        # Drop expired entries once per run rather than on every lookup
+        self._conn.execute("DELETE FROM summaries WHERE created < ?", (time.time() - self.ttl,))
+        self._conn.commit()
+    
+    @staticmethod
+    def key(data: bytes, model: str, prompt: str) -> str:
+        digest = hashlib.blake2b(data)
+        digest.update(f"\0{model}\0{prompt}".encode("utf-8"))
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT summary FROM summaries WHERE key = ? AND created >= ?",
+                (key, time.time() - self.ttl)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def put(self, key: str, summary: str):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO summaries (key, summary, created) VALUES (?, ?, ?)",
+                (key, summary, time.time())
+            )
+            self._conn.commit()
 
 class ResumeAnalyzer:
     """Main application class"""
     
-    def __init__(self, timeout: int = REQUEST_TIMEOUT):
+    def __init__(self, timeout: int = REQUEST_TIMEOUT, use_cache: bool = True):
         self.extractor = FileExtractor()
         self.validator = ResumeValidator()
         self.ollama_client = OllamaClient(timeout=timeout)
+        self.cache = None
+        if use_cache:
+            try:
+                self.cache = SummaryCache()
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Summary cache unavailable, continuing without it: {e}")
+    
+    def _cache_key(self, file_path: Path, model: str) -> Optional[str]:
+        """Key for a file's summary; the prompt preamble is included so prompt edits invalidate it"""
+        if self.cache is None:
+            return None
+        self.validate_file(file_path)
+        return self.cache.key(file_path.read_bytes(), model, self.ollama_client._build_prompt(""))
     
     def validate_file(self, file_path: Path) -> None:
         """Validate file exists and has supported extension"""
@@ -299,10 +501,8 @@ class ResumeAnalyzer:
         if file_path.stat().st_size > 10 * 1024 * 1024:
             raise ResumeAnalyzerError("File too large (max 10MB)")
     
-    def analyze(self, file_path: str, model: str, verbose: bool = False) -> str:
-        """Main analysis method"""
-        file_path = Path(file_path).resolve()
-        
+    def _load_resume(self, file_path: Path, fast: bool = True) -> Tuple[str, float, str]:
+        """Validate the file, extract its text and check that it is a resume"""
         # Validate input
         self.validate_file(file_path)
         
@@ -315,12 +515,30 @@ class ResumeAnalyzer:
         
         # Validate if it's a resume
         # logger.info("Validating if document is a resume...")
-        is_resume, confidence, explanation = self.validator.is_resume(text)
+        is_resume, confidence, explanation = self.validator.is_resume(text, fast=fast)
         
         if not is_resume:
             raise ResumeAnalyzerError(
                 f"This document doesn't appear to be a resume (confidence: {confidence:.0%}). {explanation}"
             )
+        return text, confidence, explanation
+    
+    def analyze(self, file_path: str, model: str, verbose: bool = False,
+                on_token: Optional[Callable[[str], None]] = None) -> str:
+        """Main analysis method; on_token receives the summary as it streams (not called for cached results)"""
+        file_path = Path(file_path).resolve()
+        
+        # The same file, model and prompt give the same summary, so skip extraction and the LLM
+        key = self._cache_key(file_path, model)
+        cached = self.cache.get(key) if key else None
+        if cached is not None:
+            if verbose:
+                print("\n♻️  Using cached summary for this file and model")
+            return cached
+        
+        # Verbose output reports the full confidence, so only short-circuit when it isn't shown
+        text, confidence, explanation = self._load_resume(file_path, fast=not verbose)
+        
         if verbose:
             print(f"\n✅ Resume validation passed with {confidence:.0%} confidence. {explanation}")
             print("\n📄 Extracted Resume Text:\n")
@@ -332,9 +550,44 @@ class ResumeAnalyzer:
         # Generate summary
         # logger.info(f"Generating summary using model: {model}")
         print("⏳ Analyzing resume with Ollama (this may take a minute)...")
-        summary = self.ollama_client.summarize_resume(text, model)
+        summary = self.ollama_client.summarize_resume(text, model, on_token=on_token)
+        if key:
+            self.cache.put(key, summary)
         
         return summary
+    
+    def analyze_many(self, file_paths: List[str], model: str,
+                     max_concurrency: int = MAX_CONCURRENT_REQUESTS) -> Dict[str, str]:
+        """Summarize several resumes concurrently; failures are reported per file"""
+        return asyncio.run(self.analyze_many_async(file_paths, model, max_concurrency))
+    
+    async def analyze_many_async(self, file_paths: List[str], model: str,
+                                 max_concurrency: int = MAX_CONCURRENT_REQUESTS) -> Dict[str, str]:
+        """Extract files in worker threads while at most max_concurrency summaries run in Ollama"""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def analyze_one(file_path: str) -> str:
+            try:
+                path = Path(file_path).resolve()
+                key = await asyncio.to_thread(self._cache_key, path, model)
+                cached = self.cache.get(key) if key else None
+                if cached is not None:
+                    return cached
+                
+                text, _, _ = await asyncio.to_thread(self._load_resume, path)
+                async with semaphore:
+                    summary = await asyncio.to_thread(self.ollama_client.summarize_resume, text, model)
+                if key:
+                    self.cache.put(key, summary)
+                return summary
+            except ResumeAnalyzerError as e:
+                return f"❌ Error: {e}"
+            except OSError as e:
+                # An unreadable file fails on its own instead of aborting the whole batch
+                return f"❌ Error: Cannot read {file_path}: {e}"
+        
+        summaries = await asyncio.gather(*[analyze_one(file_path) for file_path in file_paths])
+        return dict(zip(file_paths, summaries))
 
 def main():
     parser = argparse.ArgumentParser(
@@ -344,7 +597,13 @@ def main():
     
     parser.add_argument(
         "filepath", 
-        help="Path to resume file (.pdf, .docx, or .txt)"
+        nargs="*",
+        help="Path to resume file (.pdf, .docx, or .txt); several files are analyzed concurrently"
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="DIR",
+        help="Analyze every supported resume file in DIR concurrently"
     )
     parser.add_argument(
         "--model", 
@@ -361,6 +620,11 @@ def main():
         action="store_true",
         help="Suppress info messages"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-run the analysis instead of reusing a cached summary"
+    )
     parser.add_argument(
         "--timeout",
         type=int,
@@ -370,19 +634,55 @@ def main():
 
     args = parser.parse_args()
     
+    if args.batch:
+        batch_dir = Path(args.batch)
+        if not batch_dir.is_dir():
+            parser.error(f"--batch expects a directory: {args.batch}")
+        args.filepath += sorted(
+            str(path) for path in batch_dir.iterdir()
+            if path.is_file() and path.suffix.lower() in SUPPORTED_EXTENSIONS
+        )
+    if not args.filepath:
+        parser.error("provide a resume file or --batch DIR")
+    
     if args.quiet:
         logging.getLogger().setLevel(logging.WARNING)
     
+    # Print the summary as it streams in; a cached summary arrives all at once instead
+    streamed = []
     try:
-        analyzer = ResumeAnalyzer(timeout=args.timeout)
-        summary = analyzer.analyze(args.filepath, args.model, args.verbose)
+        analyzer = ResumeAnalyzer(timeout=args.timeout, use_cache=not args.no_cache)
+        if len(args.filepath) > 1:
+            print(f"⏳ Analyzing {len(args.filepath)} resumes with Ollama (this may take a few minutes)...")
+            summaries = analyzer.analyze_many(args.filepath, args.model)
+            for filepath, summary in summaries.items():
+                print(f"\n🧑‍💼 Candidate Summary: {filepath}")
+                print("=" * 50)
+                print(summary)
+                print("=" * 50)
+            return
+        
+        def print_token(token: str):
+            if not streamed:
+                print("\n🧑‍💼 Candidate Summary:")
+                print("=" * 50)
+            streamed.append(token)
+            sys.stdout.write(token)
+            sys.stdout.flush()
+        
+        summary = analyzer.analyze(args.filepath[0], args.model, args.verbose, on_token=print_token)
 
-        print("\n🧑‍💼 Candidate Summary:")
-        print("=" * 50)
-        print(summary)
+        if streamed:
+            print()
+        else:
+            print("\n🧑‍💼 Candidate Summary:")
+            print("=" * 50)
+            print(summary)
         print("=" * 50)
         
     except ResumeAnalyzerError as e:
+        if streamed:
+            print()  # End the partial summary's line
         print(f"❌ Error: {e}")
         sys.exit(1)
     except KeyboardInterrupt:
@@ -0,0 +1,58 @@
+import hashlib
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from langchain.embeddings.base import Embeddings
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import resume_agents  # noqa: E402
+
+
+class HashEmbeddings(Embeddings):
+    """Bag-of-words vectors, so tests need neither a model download nor a GPU"""
+
+    def _embed(self, text):
+        vec = np.zeros(64, dtype=np.float32)
+        for word in text.lower().split():
+            vec[int(hashlib.md5(word.encode()).hexdigest(), 16) % 64] += 1
+        return vec.tolist()
+
+    def embed_documents(self, texts):
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._embed(text)
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    # The store keeps its files relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    embeddings = resume_agents.CachedEmbeddings(HashEmbeddings(), cache_path=str(tmp_path / "embeddings.db"))
+    monkeypatch.setattr(resume_agents, "_EMBEDDINGS", embeddings)
+    return resume_agents.ResumeStore()
+
+
+def long_text(n_words):
+    return " ".join(f"word{i}" for i in range(n_words))
+
+
+def test_shorter_readd_replaces_all_chunks(store):
+    store.add_resume("c", long_text(3000) + " python", "Long resume")
+    assert len(store.vector_store._collection.get(where={"resume_id": "c"})["ids"]) > 1
+
+    store.add_resume("c", "nurse hospital patient care", "Short resume")
+    store.persist()
+
+    assert len(store.vector_store._collection.get(where={"resume_id": "c"})["ids"]) == 1
+    if store._use_faiss:
+        assert len(store._chunk_ids["c"]) == 1
+        assert store.chunk_index.ntotal == 1
+
+    # A restart rebuilds the FAISS mirror from Chroma, which must not bring the old chunks back
+    reloaded = resume_agents.ResumeStore()
+    if reloaded._use_faiss:
+        assert reloaded.chunk_index.ntotal == 1
+    assert [r["id"] for r in reloaded.search_resumes("nurse", 1)] == ["c"]
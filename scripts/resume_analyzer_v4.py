@@ -1,17 +1,82 @@
 import argparse
-import fitz  # PyMuPDF
-import docx
-import requests
+import array
+import math
+import multiprocessing
+# fitz (PyMuPDF), lxml and requests are imported where they are used, so a .txt resume
+# or a cached summary never pays for loading the PDF, DOCX and HTTP libraries
+import hashlib
+import importlib.util
+import io
+import json
 import os
 import logging
+import mmap
+import re
+import sqlite3
+import stat
+import tempfile
+import threading
+import time
+import zipfile
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, List, Optional
 import sys
 
+try:
+    import orjson  # Faster JSON for request bodies and streamed response lines
+except ImportError:
+    orjson = None
+
+# Layout-aware Markdown extraction for PDFs, used when installed (checked without importing it)
+HAS_PYMUPDF4LLM = importlib.util.find_spec("pymupdf4llm") is not None
+
 # Configuration
 OLLAMA_ENDPOINT = os.getenv("OLLAMA_ENDPOINT", "http://localhost:11434/api/generate")
+OLLAMA_EMBED_ENDPOINT = os.getenv("OLLAMA_EMBED_ENDPOINT", OLLAMA_ENDPOINT.rsplit("/api/", 1)[0] + "/api/embed")
+EMBED_MODEL = os.getenv("OLLAMA_EMBED_MODEL", "nomic-embed-text")
 SUPPORTED_EXTENSIONS = {".pdf", ".docx", ".txt"}
-REQUEST_TIMEOUT = 30
+# Longest wait for data from Ollama. Nothing arrives until the model is loaded and the prompt
+# processed, so this also has to cover a cold load of a large model before the first token
+REQUEST_TIMEOUT = 300
+CONNECT_TIMEOUT = 5
+TIMEOUT_MESSAGE = "Request timed out. Try again later or increase --timeout."
+# PDFs with at least this many pages are split across worker processes
+PARALLEL_PDF_MIN_PAGES = 32
+PARALLEL_PDF_WORKERS = min(8, os.cpu_count() or 1)
+# How long Ollama keeps the model (and its prompt cache) loaded after a request
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+# Context window sent with every summary request. Ollama reloads the model when num_ctx changes,
+# so one fixed value keeps the loaded model and its cached prompt prefix reusable across calls
+OLLAMA_NUM_CTX = int(os.getenv("OLLAMA_NUM_CTX", "8192"))
+# Summaries requested from Ollama at once in batch mode (match the server's OLLAMA_NUM_PARALLEL)
+MAX_CONCURRENT_REQUESTS = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+HTTP_POOL_SIZE = 16
+# Resume text beyond the input token budget (see MAX_INPUT_TOKENS) is trimmed from the middle
+CHARS_PER_TOKEN = 4
+# Context left free for the generated summary (a detailed one runs to roughly 1000 tokens)
+OUTPUT_TOKEN_RESERVE = 1536
+TRUNCATION_HEAD = 0.7  # Share of the kept text taken from the start of the resume
+SUMMARY_CACHE_DIR = os.getenv(
+    "RESUME_ANALYZER_CACHE_DIR", os.path.join(Path.home(), ".cache", "resume_summarizer")
+)
+SUMMARY_CACHE_TTL = 7 * 24 * 3600  # Seconds a cached summary stays valid, as in the backend
+# Cosine similarity above which a near-duplicate resume reuses a cached summary (opt-in)
+SEMANTIC_CACHE_THRESHOLD = 0.97
+# Unix socket of the --serve daemon, which keeps the analyzer and the model warm between runs.
+# It lives in a per-user directory, so on a shared host no one else can bind it or connect to it
+PRIVATE_SOCKET_DIR = os.path.join(
+    tempfile.gettempdir(), f"resume-analyzer-{os.getuid() if hasattr(os, 'getuid') else 0}"
+)
+SOCKET_PATH = os.getenv("RESUME_ANALYZER_SOCKET", os.path.join(
+    os.getenv("XDG_RUNTIME_DIR") or PRIVATE_SOCKET_DIR, "resume-analyzer.sock"
+))
+# Retries for refused connections and 502/503/504 while Ollama is loading or busy; a read
+# timeout is not retried, since resending would restart a slow generation from scratch
+HTTP_RETRIES = 2
+HTTP_RETRY_STATUSES = [502, 503, 504]
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -21,101 +86,189 @@ class ResumeAnalyzerError(Exception):
     """Custom exception for resume analyzer errors"""
     pass
 
+@contextmanager
+def _mapped_file(file_path: Path):
+    """Read-only memory map of a file, so decoding and hashing work on it without a bytes copy"""
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""  # Empty files cannot be mapped
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+def _json_dumps(obj) -> bytes:
+    """UTF-8 JSON body, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _pdf_page_range(file_path: str, start: int, stop: int) -> str:
+    """Text of pages [start, stop) of a PDF, separated by newlines"""
+    import fitz  # PyMuPDF
+    # Plain text extraction: keep whitespace and clip to the page, but expand ligatures
+    # (ﬁ -> fi) instead of preserving them, which the LLM reads better
+    flags = fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP
+    buf = io.StringIO()
+    with fitz.open(file_path) as doc:
+        for i in range(start, stop):
+            if i > start:
+                buf.write("\n")
+            buf.write(doc[i].get_text("text", flags=flags))
+    return buf.getvalue()
+
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+_pdf_pool_lock = threading.Lock()
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Process pool shared by all PDF extractions, so a batch of large PDFs never runs more workers than this"""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            # Forking while other threads are running (--serve, batches) can copy a held lock into
+            # a worker and deadlock it, so spawn the workers unless this is the only thread
+            context = multiprocessing.get_context(None if threading.active_count() == 1 else "spawn")
+            _pdf_pool = ProcessPoolExecutor(max_workers=PARALLEL_PDF_WORKERS, mp_context=context)
+        return _pdf_pool
+
+def _discard_pdf_pool(pool: ProcessPoolExecutor):
+    """Drop a pool broken by a crashed worker, so the next extraction starts a fresh one"""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is pool:
+            _pdf_pool = None
+    pool.shutdown(wait=False)
+
 class FileExtractor:
     """Handles text extraction from different file formats"""
     
     @staticmethod
     def extract_text_from_pdf(file_path: Path) -> str:
+        if HAS_PYMUPDF4LLM:
+            # Markdown keeps headings, lists and columns apart, so the LLM gets fewer, cleaner tokens
+            try:
+                import pymupdf4llm
+                return re.sub(r"\n{3,}", "\n\n", pymupdf4llm.to_markdown(str(file_path)))
+            except Exception as e:
+                logger.warning(f"Markdown extraction failed, falling back to plain text: {e}")
+        
         try:
-            doc = fitz.open(file_path)
-            text = "\n".join([page.get_text() for page in doc])
-            doc.close()
-            return text
+            import fitz  # PyMuPDF
+            with fitz.open(file_path) as doc:
+                page_count = doc.page_count
+            if page_count < PARALLEL_PDF_MIN_PAGES or PARALLEL_PDF_WORKERS < 2:
+                return _pdf_page_range(str(file_path), 0, page_count)
+            
+            # A fitz Document must not be shared between threads, so each worker process
+            # opens the file itself and extracts one contiguous slice of pages
+            step = -(-page_count // PARALLEL_PDF_WORKERS)
+            starts = range(0, page_count, step)
+            pool = _get_pdf_pool()
+            try:
+                slices = pool.map(
+                    _pdf_page_range,
+                    [str(file_path)] * len(starts), starts, [min(start + step, page_count) for start in starts]
+                )
+                return "\n".join(slices)
+            except BrokenProcessPool:
+                _discard_pdf_pool(pool)
+                raise
         except Exception as e:
             raise ResumeAnalyzerError(f"Failed to extract text from PDF: {e}")
 
+    _W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+    _DOCX_RUN_TEXT = {_W + "tab": "\t", _W + "ptab": "\t", _W + "cr": "\n", _W + "noBreakHyphen": "-"}
+    
     @staticmethod
     def extract_text_from_docx(file_path: Path) -> str:
+        from lxml import etree
+        w = FileExtractor._W
+        body = w + "body"
+        # Body-level paragraphs only, the same text python-docx's Document.paragraphs gives and the
+        # backend's FileExtractor._docx_text reads, so both analyzers see the same text for a file.
+        # Tables and text boxes are left out
         try:
-            doc = docx.Document(file_path)
-            return "\n".join([para.text for para in doc.paragraphs])
+            buf = io.StringIO()
+            with zipfile.ZipFile(file_path) as archive, archive.open("word/document.xml") as f:
+                # Parse paragraph by paragraph and free each one, instead of building python-docx objects
+                first = True
+                # Never expand entities or fetch external DTDs, as python-docx's parser does
+                events = etree.iterparse(
+                    f, events=("end",), tag=w + "p", resolve_entities=False, no_network=True
+                )
+                for _, para in events:
+                    parent = para.getparent()
+                    if parent is None or parent.tag != body:
+                        para.clear()
+                        continue
+                    if not first:
+                        buf.write("\n")
+                    first = False
+                    for run in para.iterchildren(w + "r", w + "hyperlink"):
+                        runs = run.iterchildren(w + "r") if run.tag == w + "hyperlink" else (run,)
+                        for r in runs:
+                            for el in r.iterchildren():
+                                if el.tag == w + "t":
+                                    buf.write(el.text or "")
+                                elif el.tag == w + "br":
+                                    buf.write("\n" if el.get(w + "type", "textWrapping") == "textWrapping" else "")
+                                else:
+                                    buf.write(FileExtractor._DOCX_RUN_TEXT.get(el.tag, ""))
+                    para.clear()
+                    while para.getprevious() is not None:
+                        del parent[0]
+            return buf.getvalue()
         except Exception as e:
             raise ResumeAnalyzerError(f"Failed to extract text from DOCX: {e}")
 
     @staticmethod
-    def extract_text_from_txt(file_path: Path) -> str:
+    def _decode_text(data) -> str:
+        """Decode a whole text file (bytes or mmap), normalizing newlines as text-mode open() would"""
+        # str() decodes straight from the buffer; UTF-8 decoding already has an ASCII fast path
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return f.read()
+            text = str(data, "utf-8")
         except UnicodeDecodeError:
-            # Fallback to different encoding
+            # Fallback to different encoding: Windows-1252 (Word's "plain text" export), then latin-1
             try:
-                with open(file_path, "r", encoding="latin-1") as f:
-                    return f.read()
-            except Exception as e:
-                raise ResumeAnalyzerError(f"Failed to read text file: {e}")
+                text = str(data, "cp1252")
+            except UnicodeDecodeError:
+                text = str(data, "latin-1")
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+    
+    @staticmethod
+    def extract_text_from_txt(file_path: Path) -> str:
+        try:
+            with _mapped_file(file_path) as data:
+                return FileExtractor._decode_text(data)
         except Exception as e:
             raise ResumeAnalyzerError(f"Failed to extract text from TXT: {e}")
 
+    # Extension dispatch built once; __func__ unwraps the staticmethods defined above
+    _EXTRACTORS = {
+        ".pdf": extract_text_from_pdf.__func__,
+        ".docx": extract_text_from_docx.__func__,
+        ".txt": extract_text_from_txt.__func__
+    }
+    
     def extract_text(self, file_path: Path) -> str:
         """Extract text based on file extension"""
         extension = file_path.suffix.lower()
         
-        extractors = {
-            ".pdf": self.extract_text_from_pdf,
-            ".docx": self.extract_text_from_docx,
-            ".txt": self.extract_text_from_txt
-        }
-        
-        if extension not in extractors:
+        extractor = self._EXTRACTORS.get(extension)
+        if extractor is None:
             raise ResumeAnalyzerError(f"Unsupported file format: {extension}")
         
-        return extractors[extension](file_path)
+        return extractor(file_path)
     
-class OllamaClient:
-    """Handles communication with Ollama API"""
-    
-    def __init__(self, endpoint: str = OLLAMA_ENDPOINT):
-        self.endpoint = endpoint
-    
-    def summarize_resume(self, text: str, model: str, detail_level: str = "standard") -> str:
-        if not text.strip():
-            raise ResumeAnalyzerError("Resume text is empty")
-        
-        prompt = self._build_prompt(text, detail_level)
-        
-        try:
-            response = requests.post(
-                self.endpoint,
-                json={
-                    "model": model,
-                    "prompt": prompt,
-                    "stream": False
-                },
-                timeout=REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            
-            result = response.json()
-            if "response" not in result:
-                raise ResumeAnalyzerError("Invalid response format from Ollama")
-            
-            return result["response"]
-            
-        except requests.exceptions.ConnectionError:
-            raise ResumeAnalyzerError("Cannot connect to Ollama. Is it running?")
-        except requests.exceptions.Timeout:
-            raise ResumeAnalyzerError("Request timed out. Try again later.")
-        except requests.exceptions.RequestException as e:
-            raise ResumeAnalyzerError(f"API request failed: {e}")
-        except Exception as e:
-            raise ResumeAnalyzerError(f"Unexpected error: {e}")
-    
-    def _build_prompt(self, text: str, detail_level: str) -> str:
-        """Build a prompt based on the desired detail level"""
-        
-        # Base instructions for all detail levels
-        base_instructions = """
+# Prompt instructions, shared by every detail level
+_BASE_INSTRUCTIONS = """
 You are an expert resume analyst helping recruiters and interviewers quickly assess candidates.
 Extract and summarize the key information from the resume below.
 Use clear formatting with headings, bullet points, and emojis where appropriate.
@@ -123,9 +276,9 @@ Focus only on professional qualifications and skills.
 Ignore personal details like address, phone number, etc.
 """
 
-        # Detail level specific instructions
-        detail_instructions = {
-            "brief": """
+# Detail level specific instructions
+_DETAIL_INSTRUCTIONS = {
+    "brief": """
 Create a very concise summary focusing only on:
 1. Total experience (years)
 2. Current/most recent position
@@ -133,7 +286,7 @@ Create a very concise summary focusing only on:
 4. Highest education level
 Limit to 10 lines maximum.
 """,
-            "standard": """
+    "standard": """
 Create a comprehensive professional summary including:
 
 📊 **Experience Overview:**
@@ -157,7 +310,7 @@ Create a comprehensive professional summary including:
 
 Keep the summary focused and concise, approximately 20-25 lines total.
 """,
-            "detailed": """
+    "detailed": """
 Create a detailed and structured professional analysis including:
 
 📊 **Experience Overview:**
@@ -193,31 +346,310 @@ Create a detailed and structured professional analysis including:
 Include a "Key Strengths" section that highlights what makes this candidate stand out.
 Add a "Potential Interview Focus Areas" section suggesting 3-5 topics to explore further.
 """
-        }
+}
+
+# The full instruction prefix for each level is built once so every request for a level
+# starts with byte-identical text and Ollama can reuse the already evaluated prompt tokens
+_PROMPT_PREFIXES = {
+    level: f"{_BASE_INSTRUCTIONS}\n{instructions}\n\nResume Content:\n"
+    for level, instructions in _DETAIL_INSTRUCTIONS.items()
+}
+
+# Largest resume input that fits num_ctx next to the longest prefix and the summary; anything
+# over it would make Ollama cut the start of the prompt, which is where the instructions are
+_PREFIX_TOKENS = -(-max(len(prefix) for prefix in _PROMPT_PREFIXES.values()) // CHARS_PER_TOKEN)
+MAX_INPUT_TOKENS = OLLAMA_NUM_CTX - _PREFIX_TOKENS - OUTPUT_TOKEN_RESERVE
+
+class OllamaClient:
+    """Handles communication with Ollama API"""
+    
+    def __init__(self, endpoint: str = OLLAMA_ENDPOINT, embed_endpoint: str = OLLAMA_EMBED_ENDPOINT,
+                 timeout: int = REQUEST_TIMEOUT):
+        self.endpoint = endpoint
+        self.embed_endpoint = embed_endpoint
+        # Short connect timeout; the read timeout bounds each wait for data, not the whole generation
+        self.timeout = (CONNECT_TIMEOUT, timeout)
+        self.keep_alive = OLLAMA_KEEP_ALIVE
+        self._session = None
+        self._session_lock = threading.Lock()
+    
+    def _get_session(self):
+        """One pooled session, shared by concurrent batch requests; created (and requests imported) on first use"""
+        with self._session_lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                session = requests.Session()
+                session.headers["Connection"] = "keep-alive"
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE, max_retries=Retry(
+                    total=HTTP_RETRIES, read=False, backoff_factor=0.2,
+                    status_forcelist=HTTP_RETRY_STATUSES, allowed_methods=["POST"]
+                ))
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._session = session
+            return self._session
+    
+    def summarize_resume(self, text: str, model: str, detail_level: str = "standard",
+                         on_token: Optional[Callable[[str], None]] = None) -> str:
+        """Stream the summary from Ollama, passing each piece to on_token as it arrives"""
+        import requests
+        if not text.strip():
+            raise ResumeAnalyzerError("Resume text is empty")
         
-        # Get the appropriate instructions or default to brief
-        instruction_text = detail_instructions.get(detail_level, detail_instructions["brief"])
+        prompt = self._build_prompt(text, detail_level)
         
-        return f"""{base_instructions}
-{instruction_text}
+        try:
+            with self._get_session().post(
+                self.endpoint,
+                data=_json_dumps({
+                    "model": model,
+                    "prompt": prompt,
+                    "stream": True,
+                    "keep_alive": self.keep_alive,
+                    "options": {"num_ctx": OLLAMA_NUM_CTX}
+                }),
+                headers={"Content-Type": "application/json"},
+                timeout=self.timeout,
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                
+                # Ollama sends one JSON object per line until "done"
+                summary = io.StringIO()
+                try:
+                    for line in response.iter_lines():
+                        if not line:
+                            continue
+                        chunk = _json_loads(line)
+                        if "error" in chunk:
+                            raise ResumeAnalyzerError(f"Ollama error: {chunk['error']}")
+                        if "response" not in chunk:
+                            raise ResumeAnalyzerError("Invalid response format from Ollama")
+                        summary.write(chunk["response"])
+                        if on_token:
+                            on_token(chunk["response"])
+                        if chunk.get("done"):
+                            break
+                except requests.exceptions.ConnectionError:
+                    # requests reports a read timeout in the middle of a streamed body as ConnectionError
+                    raise ResumeAnalyzerError(TIMEOUT_MESSAGE)
+            
+            return summary.getvalue()
+            
+        except requests.exceptions.ConnectionError:
+            raise ResumeAnalyzerError("Cannot connect to Ollama. Is it running?")
+        except requests.exceptions.Timeout:
+            raise ResumeAnalyzerError(TIMEOUT_MESSAGE)
+        except requests.exceptions.RequestException as e:
+            raise ResumeAnalyzerError(f"API request failed: {e}")
+        except ResumeAnalyzerError:
+            raise
+        except Exception as e:
+            raise ResumeAnalyzerError(f"Unexpected error: {e}")
+    
+    def warm_up(self, model: str):
+        """Load the model into Ollama's memory ahead of the first summary"""
+        import requests
+        try:
+            # An empty prompt only loads the model; loading a large one can take minutes, so no read timeout
+            response = self._get_session().post(
+                self.endpoint,
+                data=_json_dumps({"model": model, "prompt": "", "stream": False, "keep_alive": self.keep_alive}),
+                headers={"Content-Type": "application/json"},
+                timeout=(CONNECT_TIMEOUT, None)
+            )
+            response.raise_for_status()
+        except requests.exceptions.ConnectionError:
+            raise ResumeAnalyzerError("Cannot connect to Ollama. Is it running?")
+        except requests.exceptions.RequestException as e:
+            raise ResumeAnalyzerError(f"Could not load model {model}: {e}")
+    
+    def embed(self, text: str, model: str = EMBED_MODEL) -> List[float]:
+        """Embedding of a resume text from Ollama's embed API"""
+        import requests
+        try:
+            response = self._get_session().post(
+                self.embed_endpoint,
+                data=_json_dumps({"model": model, "input": text, "keep_alive": self.keep_alive}),
+                headers={"Content-Type": "application/json"},
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            return _json_loads(response.content)["embeddings"][0]
+        except requests.exceptions.RequestException as e:
+            raise ResumeAnalyzerError(f"Embedding request failed: {e}")
+        except (KeyError, IndexError, TypeError, ValueError):
+            raise ResumeAnalyzerError("Invalid embedding response from Ollama")
+    
+    def _build_prompt(self, text: str, detail_level: str) -> str:
+        """Build a prompt based on the desired detail level"""
+        # Unknown levels default to brief
+        prefix = _PROMPT_PREFIXES.get(detail_level, _PROMPT_PREFIXES["brief"])
+        return f"{prefix}{text}\n"
 
-Resume Content:
-{text}
-"""
+class SummaryCache:
+    """Summaries stored as one text file each, named by a hash of file content, model and prompt"""
+    
+    def __init__(self, directory: str = SUMMARY_CACHE_DIR, ttl: int = SUMMARY_CACHE_TTL):
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Drop expired entries once per run rather than on every lookup
+        self._evict_expired()
+    
+    def _evict_expired(self):
+        """Delete summaries older than the TTL, and temp files left behind by interrupted writes"""
+        cutoff = time.time() - self.ttl
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith((".txt", ".tmp")) and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+        except OSError as e:
+            logger.warning(f"Could not clean up the summary cache: {e}")
+    
+    @staticmethod
+    def key(data, model: str, detail_level: str, prompt: str, max_input_tokens: int) -> str:
+        digest = hashlib.blake2b(data, digest_size=16)
+        digest.update(f"\0{model}\0{detail_level}\0{prompt}\0{max_input_tokens}".encode("utf-8"))
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        path = self.directory / f"{key}.txt"
+        try:
+            if path.stat().st_mtime < time.time() - self.ttl:
+                return None
+            return path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+    
+    def put(self, key: str, summary: str):
+        # Write to a temporary file and rename it, so readers never see a partial summary
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(summary)
+            os.replace(tmp_path, self.directory / f"{key}.txt")
+        except OSError as e:
+            logger.warning(f"Could not cache summary: {e}")
+
+class SemanticCache:
+    """Summaries of earlier resumes stored with their embeddings (SQLite), matched by cosine similarity"""
+    
+    def __init__(self, threshold: float = SEMANTIC_CACHE_THRESHOLD, directory: str = SUMMARY_CACHE_DIR):
+        self.threshold = threshold
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(directory, "semantic_cache.db"), check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS summaries (scope TEXT, embedding BLOB, summary TEXT)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS summaries_scope ON summaries (scope)")
+        self._conn.commit()
+    
+    @staticmethod
+    def _normalize(vector: List[float]) -> array.array:
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        return array.array("f", (x / norm for x in vector))
+    
+    def get(self, vector: List[float], scope: str) -> Optional[str]:
+        """Summary of the most similar stored resume in scope, if it clears the threshold"""
+        query = self._normalize(vector)
+        with self._lock:
+            rows = self._conn.execute("SELECT embedding, summary FROM summaries WHERE scope = ?", (scope,)).fetchall()
+        best, best_summary = self.threshold, None
+        for blob, summary in rows:
+            stored = array.array("f")
+            stored.frombytes(blob)
+            if len(stored) != len(query):
+                continue
+            similarity = sum(a * b for a, b in zip(query, stored))
+            if similarity >= best:
+                best, best_summary = similarity, summary
+        return best_summary
+    
+    def put(self, vector: List[float], scope: str, summary: str):
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO summaries (scope, embedding, summary) VALUES (?, ?, ?)",
+                (scope, self._normalize(vector).tobytes(), summary)
+            )
+            self._conn.commit()
 
 class ResumeAnalyzer:
     """Main application class"""
     
-    def __init__(self):
+    def __init__(self, use_cache: bool = True, max_input_tokens: int = MAX_INPUT_TOKENS,
+                 semantic_cache_threshold: Optional[float] = None, timeout: int = REQUEST_TIMEOUT):
+        if max_input_tokens < 1:
+            raise ResumeAnalyzerError("max_input_tokens must be at least 1")
         self.extractor = FileExtractor()
-        self.ollama_client = OllamaClient()
+        self.ollama_client = OllamaClient(timeout=timeout)
+        self.max_input_tokens = max_input_tokens
+        self.cache = None
+        self.semantic_cache = None
+        if use_cache:
+            try:
+                self.cache = SummaryCache()
+            except OSError as e:
+                logger.warning(f"Summary cache unavailable, continuing without it: {e}")
+            # Off unless a threshold is given: a near match reuses another file's summary
+            if semantic_cache_threshold is not None:
+                try:
+                    self.semantic_cache = SemanticCache(semantic_cache_threshold)
+                except (OSError, sqlite3.Error) as e:
+                    logger.warning(f"Semantic cache unavailable, continuing without it: {e}")
+    
+    def _cache_key(self, file_path: Path, model: str, detail_level: str) -> Optional[str]:
+        """Key for a validated file's summary; the prompt prefix is included so prompt edits invalidate it"""
+        if self.cache is None:
+            return None
+        prompt = self.ollama_client._build_prompt("", detail_level)
+        with _mapped_file(file_path) as data:
+            return self.cache.key(data, model, detail_level, prompt, self.max_input_tokens)
+    
+    def _semantic_scope(self, model: str, detail_level: str) -> str:
+        """Only summaries made with the same model, prompt, input budget and embedding model are comparable"""
+        prompt = self.ollama_client._build_prompt("", detail_level)
+        return SummaryCache.key(EMBED_MODEL.encode("utf-8"), model, detail_level, prompt, self.max_input_tokens)
+    
+    def _summarize(self, text: str, model: str, detail_level: str, key: Optional[str],
+                   on_token: Optional[Callable[[str], None]] = None, verbose: bool = False) -> str:
+        """Summarize extracted text, reusing a near-duplicate's summary when the semantic cache is on"""
+        vector = None
+        if self.semantic_cache is not None:
+            scope = self._semantic_scope(model, detail_level)
+            try:
+                vector = self.ollama_client.embed(text)
+                similar = self.semantic_cache.get(vector, scope)
+            except ResumeAnalyzerError as e:
+                logger.warning(f"Semantic cache lookup failed, summarizing normally: {e}")
+            else:
+                if similar is not None:
+                    if verbose:
+                        print("♻️  Using the cached summary of a near-identical resume")
+                    if key:
+                        self.cache.put(key, similar)
+                    return similar
+        
+        summary = self.ollama_client.summarize_resume(text, model, detail_level, on_token)
+        if key:
+            self.cache.put(key, summary)
+        if vector is not None:
+            self.semantic_cache.put(vector, scope, summary)
+        return summary
     
     def validate_file(self, file_path: Path) -> None:
         """Validate file exists and has supported extension"""
-        if not file_path.exists():
+        # One stat call answers existence, file type and size
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
             raise ResumeAnalyzerError(f"File not found: {file_path}")
+        except OSError as e:
+            raise ResumeAnalyzerError(f"Cannot access file: {e}")
         
-        if not file_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             raise ResumeAnalyzerError(f"Path is not a file: {file_path}")
         
         if file_path.suffix.lower() not in SUPPORTED_EXTENSIONS:
@@ -225,24 +657,51 @@ class ResumeAnalyzer:
             raise ResumeAnalyzerError(f"Unsupported file format. Supported: {supported}")
         
         # Check file size (limit to 10MB)
-        if file_path.stat().st_size > 10 * 1024 * 1024:
+        if st.st_size > 10 * 1024 * 1024:
             raise ResumeAnalyzerError("File too large (max 10MB)")
     
-    def analyze(self, file_path: str, model: str, detail_level: str = "standard", verbose: bool = False) -> str:
+    def _load_text(self, file_path: Path, verbose: bool = False) -> str:
+        """Extract a validated resume file's text, trimmed to the input token budget"""
+        text = self.extractor.extract_text(file_path)
+        
+        # Prefill time grows with prompt length, so drop runs of spaces and blank lines first
+        text = re.sub(r"[ \t]+", " ", text)
+        text = re.sub(r"\n{3,}", "\n\n", text).strip()
+        if not text:
+            raise ResumeAnalyzerError("No text found in the document")
+        
+        max_chars = self.max_input_tokens * CHARS_PER_TOKEN
+        if len(text) > max_chars:
+            # Keep the start (contact, summary, recent roles) and the end (education, skills)
+            head = int(max_chars * TRUNCATION_HEAD)
+            tail = max_chars - head
+            if verbose:
+                print(f"\n✂️  Resume text trimmed to ~{self.max_input_tokens} tokens "
+                      f"(kept {max_chars / len(text):.0%} of {len(text)} characters)")
+            text = text[:head] + "\n...[truncated]...\n" + text[len(text) - tail:]
+        return text
+    
+    def analyze(self, file_path: str, model: str, detail_level: str = "standard", verbose: bool = False,
+                on_token: Optional[Callable[[str], None]] = None) -> str:
         """Main analysis method"""
-        file_path = Path(file_path).resolve()
+        file_path = Path(file_path)
         
         #logger.info(f"Analyzing resume: {file_path}")
         
         # Validate input
         self.validate_file(file_path)
         
+        # The same file, model and detail level give the same summary, so skip extraction and the LLM
+        key = self._cache_key(file_path, model, detail_level)
+        cached = self.cache.get(key) if key else None
+        if cached is not None:
+            if verbose:
+                print("\n♻️  Using cached summary for this file, model and detail level")
+            return cached
+        
         # Extract text
         #logger.info("Extracting text...")
-        text = self.extractor.extract_text(file_path)
-        
-        if not text.strip():
-            raise ResumeAnalyzerError("No text found in the document")
+        text = self._load_text(file_path, verbose)
         
         if verbose:
             print("\n📄 Extracted Resume Text:\n")
@@ -253,9 +712,146 @@ class ResumeAnalyzer:
         
         # Generate summary
         #logger.info(f"Generating summary using model: {model}, detail level: {detail_level}")
-        summary = self.ollama_client.summarize_resume(text, model, detail_level)
+        summary = self._summarize(text, model, detail_level, key, on_token, verbose)
         
         return summary
+    
+    def analyze_many(self, file_paths: List[str], model: str, detail_level: str = "standard",
+                     max_concurrency: int = MAX_CONCURRENT_REQUESTS) -> Dict[str, str]:
+        """Summarize several resumes concurrently; failures are reported per file"""
+        def extract_one(file_path: str):
+            """(cache key, cached summary or extracted text, or the error)"""
+            try:
+                path = Path(file_path)
+                self.validate_file(path)
+                key = self._cache_key(path, model, detail_level)
+                cached = self.cache.get(key) if key else None
+                if cached is not None:
+                    return key, cached, True
+                return key, self._load_text(path), False
+            except ResumeAnalyzerError as e:
+                return None, e, False
+        
+        def summarize_one(loaded) -> str:
+            key, text, cached = loaded
+            if isinstance(text, ResumeAnalyzerError):
+                return f"❌ Error: {text}"
+            if cached:
+                return text
+            try:
+                return self._summarize(text, model, detail_level, key)
+            except ResumeAnalyzerError as e:
+                return f"❌ Error: {e}"
+        
+        # PyMuPDF releases the GIL while extracting, so files are read in parallel threads;
+        # the summaries share one prompt prefix per detail level, which Ollama evaluates once
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as extract_pool, \
+                ThreadPoolExecutor(max_workers=max_concurrency) as request_pool:
+            texts = extract_pool.map(extract_one, file_paths)
+            summaries = list(request_pool.map(summarize_one, texts))
+        return dict(zip(file_paths, summaries))
+
+def _check_socket_dir(socket_path: str, create: bool = False):
+    """Make sure the default socket directory under the shared temp dir is ours and private"""
+    socket_dir = os.path.dirname(socket_path)
+    if socket_dir != PRIVATE_SOCKET_DIR:
+        return
+    if create:
+        os.makedirs(socket_dir, mode=0o700, exist_ok=True)
+    try:
+        st = os.lstat(socket_dir)
+    except FileNotFoundError:
+        return  # Nothing to connect to yet
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise ResumeAnalyzerError(
+            f"{socket_dir} is not a private directory owned by you. "
+            f"Remove it or set RESUME_ANALYZER_SOCKET to another path"
+        )
+
+def serve(analyzer: ResumeAnalyzer, model: str, socket_path: str = SOCKET_PATH):
+    """Answer summary requests on a Unix socket, one JSON line in and one out per connection"""
+    import socket
+    import socketserver
+    if not hasattr(socket, "AF_UNIX"):
+        raise ResumeAnalyzerError("--serve needs Unix domain sockets, which this platform lacks")
+    
+    class SummaryHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            line = self.rfile.readline()
+            if not line:
+                return  # Connection probe, e.g. from another --serve checking for a live server
+            try:
+                request = _json_loads(line)
+                summary = analyzer.analyze(request["path"], request.get("model", model), request.get("detail", "standard"))
+                reply = {"summary": summary}
+            except ResumeAnalyzerError as e:
+                reply = {"error": str(e)}
+            except Exception as e:
+                logger.error(f"Unexpected error: {e}")
+                reply = {"error": "Unexpected error occurred. Check the server logs for details."}
+            try:
+                self.wfile.write(_json_dumps(reply) + b"\n")
+            except OSError:
+                logger.warning("Client disconnected before the summary was sent")
+    
+    _check_socket_dir(socket_path, create=True)
+    
+    # A socket file left by a crashed server is replaced, but a live server is not taken over
+    if os.path.exists(socket_path):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            if probe.connect_ex(socket_path) == 0:
+                raise ResumeAnalyzerError(f"A resume analyzer server is already running at {socket_path}")
+        try:
+            os.unlink(socket_path)
+        except OSError as e:
+            raise ResumeAnalyzerError(
+                f"Cannot remove the stale socket {socket_path} ({e}). "
+                f"Remove it or set RESUME_ANALYZER_SOCKET to another path"
+            )
+    
+    # Keep the model resident for as long as the server runs, and load it now rather than on the first request
+    analyzer.ollama_client.keep_alive = -1
+    print(f"⏳ Loading {model} in Ollama...")
+    analyzer.ollama_client.warm_up(model)
+    
+    old_umask = os.umask(0o177)  # Only the current user may connect
+    try:
+        server = socketserver.ThreadingUnixStreamServer(socket_path, SummaryHandler)
+    finally:
+        os.umask(old_umask)
+    with server:
+        print(f"✅ Serving resume summaries on {socket_path} (Ctrl+C to stop)")
+        try:
+            server.serve_forever()
+        finally:
+            os.unlink(socket_path)
+
+def request_summary(file_path: str, model: str, detail_level: str, socket_path: str = SOCKET_PATH) -> str:
+    """Have a running --serve daemon summarize a file"""
+    import socket
+    # Refuse a socket directory someone else planted, which would receive our files
+    _check_socket_dir(socket_path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            raise ResumeAnalyzerError(f"No resume analyzer server at {socket_path}. Start one with --serve")
+        # The server may run in another directory, so send an absolute path
+        request = {"path": os.path.abspath(file_path), "model": model, "detail": detail_level}
+        sock.sendall(_json_dumps(request) + b"\n")
+        with sock.makefile("rb") as f:
+            line = f.readline()
+    if not line:
+        raise ResumeAnalyzerError("The server closed the connection without replying")
+    try:
+        reply = _json_loads(line)
+    except ValueError:
+        reply = None
+    if not isinstance(reply, dict) or not ("error" in reply or "summary" in reply):
+        raise ResumeAnalyzerError("Invalid reply from the server")
+    if "error" in reply:
+        raise ResumeAnalyzerError(reply["error"])
+    return reply["summary"]
 
 def main():
     parser = argparse.ArgumentParser(
@@ -266,12 +862,21 @@ Examples:
   python resume_analyzer_v3.py resume.pdf
   python resume_analyzer_v3.py resume.docx --model llama3 --detail brief
   python resume_analyzer_v3.py resume.txt --model mistral --detail detailed --verbose
+  python resume_analyzer_v3.py --batch resumes/ --detail brief
+  python resume_analyzer_v3.py --serve --model llama3 &
+  python resume_analyzer_v3.py resume.pdf --use-server
         """
     )
     
     parser.add_argument(
         "filepath", 
-        help="Path to resume file (.pdf, .docx, or .txt)"
+        nargs="*",
+        help="Path to resume file (.pdf, .docx, or .txt); several files are analyzed concurrently"
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="DIR",
+        help="Analyze every supported resume file in DIR concurrently"
     )
     parser.add_argument(
         "--model", 
@@ -289,6 +894,43 @@ Examples:
         action="store_true", 
         help="Print full extracted text before summarizing"
     )
+    parser.add_argument(
+        "--timeout",
+        type=int,
+        default=REQUEST_TIMEOUT,
+        help=f"Seconds to wait for the first and each later part of Ollama's streamed reply "
+             f"(default: {REQUEST_TIMEOUT})"
+    )
+    parser.add_argument(
+        "--max-input-tokens",
+        type=int,
+        default=MAX_INPUT_TOKENS,
+        help=f"Trim longer resumes to about this many tokens before summarizing (default: {MAX_INPUT_TOKENS})"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-analyze instead of reusing a cached summary"
+    )
+    parser.add_argument(
+        "--semantic-cache-threshold",
+        type=float,
+        nargs="?",
+        const=SEMANTIC_CACHE_THRESHOLD,
+        metavar="SIMILARITY",
+        help=f"Reuse the summary of a near-identical earlier resume (embedding similarity, "
+             f"default {SEMANTIC_CACHE_THRESHOLD} when given without a value)"
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help=f"Run as a background server on a Unix socket (default: {SOCKET_PATH}) with the model kept loaded"
+    )
+    parser.add_argument(
+        "--use-server",
+        action="store_true",
+        help="Send the files to a running --serve server instead of analyzing them in this process"
+    )
     parser.add_argument(
         "--quiet",
         action="store_true",
@@ -296,17 +938,100 @@ Examples:
     )
 
     args = parser.parse_args()
+    if args.max_input_tokens < 1:
+        parser.error("--max-input-tokens must be at least 1")
+    if args.max_input_tokens > MAX_INPUT_TOKENS:
+        parser.error(
+            f"--max-input-tokens {args.max_input_tokens} does not fit in a context of {OLLAMA_NUM_CTX} tokens "
+            f"(at most {MAX_INPUT_TOKENS}); raise OLLAMA_NUM_CTX for longer inputs"
+        )
+    
+    if args.serve and (args.filepath or args.batch):
+        parser.error("--serve takes no files; send them to the server with --use-server")
+    if args.use_server:
+        if args.serve:
+            parser.error("--serve and --use-server cannot be combined")
+        # The server was started with its own values for these, so they would be silently ignored
+        server_options = [
+            option for option, dest in [
+                ("--timeout", "timeout"),
+                ("--max-input-tokens", "max_input_tokens"),
+                ("--no-cache", "no_cache"),
+                ("--semantic-cache-threshold", "semantic_cache_threshold"),
+                ("--verbose", "verbose"),
+            ]
+            if getattr(args, dest) != parser.get_default(dest)
+        ]
+        if server_options:
+            parser.error(f"{', '.join(server_options)} cannot be used with --use-server, "
+                         f"which runs with the server's own settings")
     
     if args.quiet:
         logging.getLogger().setLevel(logging.WARNING)
     
+    if args.batch:
+        batch_dir = Path(args.batch)
+        if not batch_dir.is_dir():
+            parser.error(f"--batch expects a directory: {args.batch}")
+        args.filepath += sorted(
+            str(path) for path in batch_dir.iterdir()
+            if path.is_file() and path.suffix.lower() in SUPPORTED_EXTENSIONS
+        )
+    if not args.filepath and not args.serve:
+        parser.error("provide a resume file or --batch DIR")
+    
     try:
-        analyzer = ResumeAnalyzer()
-        summary = analyzer.analyze(args.filepath, args.model, args.detail, args.verbose)
+        if args.use_server:
+            for filepath in args.filepath:
+                try:
+                    summary = request_summary(filepath, args.model, args.detail)
+                except ResumeAnalyzerError as e:
+                    if len(args.filepath) == 1:
+                        raise
+                    summary = f"❌ Error: {e}"
+                print(f"\n🧑‍💼 Candidate Summary: {filepath}")
+                print("=" * 50)
+                print(summary)
+                print("=" * 50)
+            return
         
-        print("\n🧑‍💼 Candidate Summary:")
-        print("=" * 50)
-        print(summary)
+        analyzer = ResumeAnalyzer(
+            use_cache=not args.no_cache,
+            max_input_tokens=args.max_input_tokens,
+            semantic_cache_threshold=args.semantic_cache_threshold,
+            timeout=args.timeout
+        )
+        if args.serve:
+            serve(analyzer, args.model)
+            return
+        
+        if len(args.filepath) > 1:
+            summaries = analyzer.analyze_many(args.filepath, args.model, args.detail)
+            for filepath, summary in summaries.items():
+                print(f"\n🧑‍💼 Candidate Summary: {filepath}")
+                print("=" * 50)
+                print(summary)
+                print("=" * 50)
+            return
+        
+        streamed = []
+        
+        def print_token(token: str):
+            if not streamed:
+                print("\n🧑‍💼 Candidate Summary:")
+                print("=" * 50)
+            streamed.append(token)
+            sys.stdout.write(token)
+            sys.stdout.flush()
+        
+        summary = analyzer.analyze(args.filepath[0], args.model, args.detail, args.verbose, on_token=print_token)
+        
+        if streamed:
+            print()
+        else:
+            print("\n🧑‍💼 Candidate Summary:")
+            print("=" * 50)
+            print(summary)
         print("=" * 50)
         
         if args.detail == "brief":